@@ -6,22 +6,158 @@ import logging
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QPushButton,
-    QCheckBox, QTextEdit, QFileDialog, QMessageBox, QProgressBar
+    QCheckBox, QPlainTextEdit, QFileDialog, QMessageBox, QProgressBar
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 
 from vts_backup_manager import VTSBackupManager, BackupOptions, RestoreOptions
 from vts_discovery import get_vts_discovery
+from result_dialog import RestoreResultDialog
+from styles import styled_message_box
 
 logger = logging.getLogger(__name__)
 
 
+# Stylesheets are applied once on BackupRestoreWidget and reach children via
+# object-name selectors, so child dialogs (message boxes, results) are unaffected.
+_GROUP_QSS = """
+    QGroupBox#sectionGroup {
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #2d2d2d;
+    }
+    QGroupBox#sectionGroup::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QWidget#sectionContent {
+        background-color: transparent;
+    }
+"""
+
+_CHECKBOX_QSS = """
+    QCheckBox { color: #ffffff; background-color: transparent; }
+    QCheckBox#sensitiveCheck { color: #ffaa00; }
+"""
+
+_LABEL_QSS = """
+    QLabel#fieldLabel { color: #ffffff; background-color: transparent; }
+    QLabel#fileLabel { color: #cccccc; background-color: transparent; }
+    QLabel#warningLabel { color: #ffaa00; background-color: transparent; padding: 10px; }
+"""
+
+_NOTES_QSS = """
+    QPlainTextEdit#backupNotes {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        padding: 5px;
+    }
+"""
+
+_BTN_PRIMARY_QSS = """
+    QPushButton#primaryButton {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #0098ff;
+    }
+    QPushButton#primaryButton:disabled {
+        background-color: #2d2d2d;
+        color: #666666;
+    }
+"""
+
+_BTN_SECONDARY_QSS = """
+    QPushButton#secondaryButton {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: none;
+        padding: 6px 15px;
+        border-radius: 3px;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #4d4d4d;
+    }
+"""
+
+_BTN_WARN_QSS = """
+    QPushButton#warnButton {
+        background-color: #cc6600;
+        color: #ffffff;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+    QPushButton#warnButton:hover {
+        background-color: #ff8800;
+    }
+    QPushButton#warnButton:disabled {
+        background-color: #2d2d2d;
+        color: #666666;
+    }
+"""
+
+_PROGRESS_QSS = """
+    QProgressBar {
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        background-color: #2d2d2d;
+        color: #ffffff;
+        text-align: center;
+    }
+    QProgressBar#backupProgress::chunk {
+        background-color: #007acc;
+    }
+    QProgressBar#restoreProgress::chunk {
+        background-color: #cc6600;
+    }
+"""
+
+_WIDGET_QSS = (
+    _GROUP_QSS + _CHECKBOX_QSS + _LABEL_QSS + _NOTES_QSS
+    + _BTN_PRIMARY_QSS + _BTN_SECONDARY_QSS + _BTN_WARN_QSS + _PROGRESS_QSS
+)
+
+# (attribute, BackupOptions field, label, default) for the backup option checkboxes
+_BACKUP_CHECKS = (
+    ("backup_global_check", "include_global_config", "Global settings (vts_config.json)", True),
+    ("backup_models_check", "include_model_configs", "All model configs", True),
+    ("backup_items_check", "include_item_configs", "All item configs", True),
+    ("backup_params_check", "include_custom_parameters", "Custom parameters", True),
+    ("backup_calibration_check", "include_calibration", "Calibration data", True),
+    ("backup_effects_check", "include_visual_effects", "Visual effects settings", True),
+    ("backup_auth_check", "include_plugin_auth", "Plugin auth tokens (⚠ sensitive)", False),
+)
+
+# Message texts
+_BACKUP_DONE_TMPL = "Backup created successfully!\n\n{}"
+_BACKUP_ERR_TMPL = "An error occurred during backup:\n\n{}"
+_RESTORE_ERR_TMPL = "An error occurred during restore:\n\n{}"
+_CONFIRM_RESTORE_TEXT = (
+    "This will restore your VTS configuration from the backup.\n\n"
+    "⚠ Your current settings will be overwritten!\n\n"
+    "Make sure VTube Studio is closed before proceeding.\n\n"
+    "Continue?"
+)
+
+
 class BackupThread(QThread):
-    """Thread for creating backups."""
+    """Thread for creating backups (reusable: set the job fields, then start())."""
     finished = pyqtSignal(object)  # Path or None
     error = pyqtSignal(str)
     
-    def __init__(self, manager, vts_root, output_path, options):
+    def __init__(self, manager, vts_root=None, output_path=None, options=None):
         super().__init__()
         self.manager = manager
         self.vts_root = vts_root
@@ -37,11 +173,11 @@ class BackupThread(QThread):
 
 
 class RestoreThread(QThread):
-    """Thread for restoring backups."""
+    """Thread for restoring backups (reusable: set the job fields, then start())."""
     finished = pyqtSignal(object)  # RestoreReport
     error = pyqtSignal(str)
     
-    def __init__(self, manager, backup_path, vts_root, options):
+    def __init__(self, manager, backup_path=None, vts_root=None, options=None):
         super().__init__()
         self.manager = manager
         self.backup_path = backup_path
@@ -64,16 +200,36 @@ class BackupRestoreWidget(QWidget):
         
         self.manager = VTSBackupManager()
         self.discovery = get_vts_discovery()
-        self.backup_thread = None
-        self.restore_thread = None
+        
+        # Worker threads are created and connected once, then restarted per job.
+        # Results always arrive from the worker thread, so queue them explicitly.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.backup_thread = BackupThread(self.manager)
+        self.backup_thread.finished.connect(self.on_backup_finished, queued)
+        self.backup_thread.error.connect(self.on_backup_error, queued)
+        
+        self.restore_thread = RestoreThread(self.manager)
+        self.restore_thread.finished.connect(self.on_restore_finished, queued)
+        self.restore_thread.error.connect(self.on_restore_error, queued)
         
         # Remember last backup location
         self.last_backup_path = None
         
+        # Default location for the file dialogs
+        self._home = Path.home()
+        self._suggested_backup_name = f"vts_backup_{self._home.name}.zip"
+        
         self.setup_ui()
+        
+        # Message boxes are reused for every notification of the same severity
+        self._info_box = styled_message_box(self, QMessageBox.Icon.Information, "", "", accent=True)
+        self._warn_box = styled_message_box(self, QMessageBox.Icon.Warning, "", "")
+        self._err_box = styled_message_box(self, QMessageBox.Icon.Critical, "", "")
     
     def setup_ui(self):
         """Setup the UI."""
+        self.setStyleSheet(_WIDGET_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
@@ -88,160 +244,86 @@ class BackupRestoreWidget(QWidget):
     def create_backup_section(self) -> QGroupBox:
         """Create backup section."""
         group = QGroupBox("Create Backup")
-        group.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #2d2d2d;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setObjectName("sectionGroup")
         
         layout = QVBoxLayout(group)
         
         # Options checkboxes
-        self.backup_global_check = QCheckBox("Global settings (vts_config.json)")
-        self.backup_global_check.setChecked(True)
-        self.backup_global_check.setStyleSheet("color: #ffffff; background-color: transparent;")
-        layout.addWidget(self.backup_global_check)
-        
-        self.backup_models_check = QCheckBox("All model configs")
-        self.backup_models_check.setChecked(True)
-        self.backup_models_check.setStyleSheet("color: #ffffff; background-color: transparent;")
-        layout.addWidget(self.backup_models_check)
-        
-        self.backup_items_check = QCheckBox("All item configs")
-        self.backup_items_check.setChecked(True)
-        self.backup_items_check.setStyleSheet("color: #ffffff; background-color: transparent;")
-        layout.addWidget(self.backup_items_check)
-        
-        self.backup_params_check = QCheckBox("Custom parameters")
-        self.backup_params_check.setChecked(True)
-        self.backup_params_check.setStyleSheet("color: #ffffff; background-color: transparent;")
-        layout.addWidget(self.backup_params_check)
-        
-        self.backup_calibration_check = QCheckBox("Calibration data")
-        self.backup_calibration_check.setChecked(True)
-        self.backup_calibration_check.setStyleSheet("color: #ffffff; background-color: transparent;")
-        layout.addWidget(self.backup_calibration_check)
-        
-        self.backup_effects_check = QCheckBox("Visual effects settings")
-        self.backup_effects_check.setChecked(True)
-        self.backup_effects_check.setStyleSheet("color: #ffffff; background-color: transparent;")
-        layout.addWidget(self.backup_effects_check)
-        
-        self.backup_auth_check = QCheckBox("Plugin auth tokens (⚠ sensitive)")
-        self.backup_auth_check.setChecked(False)
-        self.backup_auth_check.setStyleSheet("color: #ffaa00; background-color: transparent;")
-        layout.addWidget(self.backup_auth_check)
+        self._backup_option_checks = []
+        for attr, option, label, checked in _BACKUP_CHECKS:
+            check = QCheckBox(label)
+            check.setChecked(checked)
+            setattr(self, attr, check)
+            self._backup_option_checks.append((option, check))
+            layout.addWidget(check)
+        self.backup_auth_check.setObjectName("sensitiveCheck")
         
         # Notes
         notes_label = QLabel("Notes (optional):")
-        notes_label.setStyleSheet("color: #ffffff; background-color: transparent;")
+        notes_label.setObjectName("fieldLabel")
         layout.addWidget(notes_label)
         
-        self.backup_notes = QTextEdit()
+        self.backup_notes = QPlainTextEdit()
+        self.backup_notes.setObjectName("backupNotes")
         self.backup_notes.setPlaceholderText("Add notes about this backup...")
         self.backup_notes.setMaximumHeight(60)
-        self.backup_notes.setStyleSheet("""
-            QTextEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                padding: 5px;
-            }
-        """)
         layout.addWidget(self.backup_notes)
         
         # Create button
         self.create_backup_btn = QPushButton("Create Backup ZIP...")
-        self.create_backup_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0098ff;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-            }
-        """)
+        self.create_backup_btn.setObjectName("primaryButton")
         self.create_backup_btn.clicked.connect(self.create_backup)
         layout.addWidget(self.create_backup_btn)
         
         # Progress bar
         self.backup_progress = QProgressBar()
+        self.backup_progress.setObjectName("backupProgress")
+        self.backup_progress.setTextVisible(False)  # Only ever used as a busy indicator
         self.backup_progress.setVisible(False)
-        self.backup_progress.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                background-color: #2d2d2d;
-                color: #ffffff;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #007acc;
-            }
-        """)
         layout.addWidget(self.backup_progress)
         
         return group
     
     def create_restore_section(self) -> QGroupBox:
-        """Create restore section."""
+        """Create the restore section; its contents are built after the widget is first shown."""
         group = QGroupBox("Restore from Backup")
-        group.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #2d2d2d;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setObjectName("sectionGroup")
         
-        layout = QVBoxLayout(group)
+        self._restore_layout = QVBoxLayout(group)
+        self._restore_content = None
+        
+        return group
+    
+    def showEvent(self, event):
+        """Build the restore widgets once the first paint is out of the way."""
+        super().showEvent(event)
+        if self._restore_content is None:
+            QTimer.singleShot(0, self._add_restore_content)
+    
+    def _add_restore_content(self):
+        """Add the restore widgets to the restore section (first call only)."""
+        if self._restore_content is not None:
+            return
+        self._restore_content = self._build_restore_section()
+        self._restore_layout.addWidget(self._restore_content)
+    
+    def _build_restore_section(self) -> QWidget:
+        """Create the restore section widgets."""
+        content = QWidget()
+        content.setObjectName("sectionContent")
+        
+        layout = QVBoxLayout(content)
+        layout.setContentsMargins(0, 0, 0, 0)
         
         # File selection
         file_layout = QHBoxLayout()
         
         self.backup_file_label = QLabel("No backup file selected")
-        self.backup_file_label.setStyleSheet("color: #cccccc; background-color: transparent;")
+        self.backup_file_label.setObjectName("fileLabel")
         file_layout.addWidget(self.backup_file_label, 1)
         
         browse_btn = QPushButton("Browse...")
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 6px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        browse_btn.setObjectName("secondaryButton")
         browse_btn.clicked.connect(self.browse_backup_file)
         file_layout.addWidget(browse_btn)
         
@@ -250,74 +332,50 @@ class BackupRestoreWidget(QWidget):
         # Options
         self.restore_pre_backup_check = QCheckBox("Create backup before restoring (recommended)")
         self.restore_pre_backup_check.setChecked(True)
-        self.restore_pre_backup_check.setStyleSheet("color: #ffffff; background-color: transparent;")
         layout.addWidget(self.restore_pre_backup_check)
         
         # Warning
         warning_label = QLabel("⚠ Warning: Restoring will overwrite your current VTS settings.\nMake sure VTube Studio is closed before restoring!")
-        warning_label.setStyleSheet("color: #ffaa00; background-color: transparent; padding: 10px;")
+        warning_label.setObjectName("warningLabel")
         warning_label.setWordWrap(True)
         layout.addWidget(warning_label)
         
         # Restore button
         self.restore_btn = QPushButton("Restore from ZIP")
+        self.restore_btn.setObjectName("warnButton")
         self.restore_btn.setEnabled(False)
-        self.restore_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #cc6600;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #ff8800;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-            }
-        """)
         self.restore_btn.clicked.connect(self.restore_backup)
         layout.addWidget(self.restore_btn)
         
         # Progress bar
         self.restore_progress = QProgressBar()
+        self.restore_progress.setObjectName("restoreProgress")
+        self.restore_progress.setTextVisible(False)  # Only ever used as a busy indicator
         self.restore_progress.setVisible(False)
-        self.restore_progress.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                background-color: #2d2d2d;
-                color: #ffffff;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #cc6600;
-            }
-        """)
         layout.addWidget(self.restore_progress)
         
-        return group
+        return content
+    
+    def _show_message(self, msg: QMessageBox, title: str, text: str,
+                      buttons=QMessageBox.StandardButton.Ok):
+        """Show one of the cached message boxes with new content."""
+        msg.setWindowTitle(title)
+        msg.setText(text)
+        msg.setStandardButtons(buttons)
+        return msg.exec()
     
     def create_backup(self):
         """Create a backup."""
-        if not self.discovery.vts_root:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("VTS Not Found")
-            msg.setText("VTube Studio installation not found.")
-            msg.setStyleSheet("QMessageBox { background-color: #1e1e1e; color: #ffffff; }")
-            msg.exec()
+        vts_root = self.discovery.vts_root
+        if not vts_root:
+            self._show_message(self._warn_box, "VTS Not Found", "VTube Studio installation not found.")
             return
         
         # Ask for save location
-        suggested_name = f"vts_backup_{Path.home().name}.zip"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Backup As",
-            str(Path.home() / suggested_name),
+            str(self._home / self._suggested_backup_name),
             "ZIP Files (*.zip)"
         )
         
@@ -326,13 +384,7 @@ class BackupRestoreWidget(QWidget):
         
         # Build options
         options = BackupOptions(
-            include_global_config=self.backup_global_check.isChecked(),
-            include_model_configs=self.backup_models_check.isChecked(),
-            include_item_configs=self.backup_items_check.isChecked(),
-            include_custom_parameters=self.backup_params_check.isChecked(),
-            include_calibration=self.backup_calibration_check.isChecked(),
-            include_plugin_auth=self.backup_auth_check.isChecked(),
-            include_visual_effects=self.backup_effects_check.isChecked(),
+            **{option: check.isChecked() for option, check in self._backup_option_checks},
             user_notes=self.backup_notes.toPlainText(),
             backup_reason="manual"
         )
@@ -342,15 +394,11 @@ class BackupRestoreWidget(QWidget):
         self.backup_progress.setRange(0, 0)  # Indeterminate
         self.create_backup_btn.setEnabled(False)
         
-        # Create backup in thread
-        self.backup_thread = BackupThread(
-            self.manager,
-            self.discovery.vts_root,
-            Path(file_path),
-            options
-        )
-        self.backup_thread.finished.connect(self.on_backup_finished)
-        self.backup_thread.error.connect(self.on_backup_error)
+        # Create backup in thread (the previous run may still be unwinding after its emit)
+        self.backup_thread.wait()
+        self.backup_thread.vts_root = vts_root
+        self.backup_thread.output_path = Path(file_path)
+        self.backup_thread.options = options
         self.backup_thread.start()
     
     def on_backup_finished(self, backup_path):
@@ -361,50 +409,23 @@ class BackupRestoreWidget(QWidget):
         if backup_path:
             self.last_backup_path = backup_path
             
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Information)
-            msg.setWindowTitle("Backup Complete")
-            msg.setText(f"Backup created successfully!\n\n{backup_path}")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #007acc; color: #ffffff; }
-            """)
-            msg.exec()
+            self._show_message(self._info_box, "Backup Complete", _BACKUP_DONE_TMPL.format(backup_path))
         else:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Critical)
-            msg.setWindowTitle("Backup Failed")
-            msg.setText("Failed to create backup. Check logs for details.")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; }
-            """)
-            msg.exec()
+            self._show_message(self._err_box, "Backup Failed", "Failed to create backup. Check logs for details.")
     
     def on_backup_error(self, error):
         """Handle backup error."""
         self.backup_progress.setVisible(False)
         self.create_backup_btn.setEnabled(True)
         
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Critical)
-        msg.setWindowTitle("Backup Error")
-        msg.setText(f"An error occurred during backup:\n\n{error}")
-        msg.setStyleSheet("""
-            QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-            QLabel { color: #ffffff; }
-            QPushButton { background-color: #3d3d3d; color: #ffffff; }
-        """)
-        msg.exec()
+        self._show_message(self._err_box, "Backup Error", _BACKUP_ERR_TMPL.format(error))
     
     def browse_backup_file(self):
         """Browse for backup file to restore."""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Backup File",
-            str(Path.home()),
+            str(self._home),
             "ZIP Files (*.zip)"
         )
         
@@ -415,27 +436,19 @@ class BackupRestoreWidget(QWidget):
     
     def restore_backup(self):
         """Restore from backup."""
-        if not self.last_backup_path or not self.discovery.vts_root:
+        vts_root = self.discovery.vts_root
+        if not self.last_backup_path or not vts_root:
             return
         
         # Confirm
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setWindowTitle("Confirm Restore")
-        msg.setText(
-            "This will restore your VTS configuration from the backup.\n\n"
-            "⚠ Your current settings will be overwritten!\n\n"
-            "Make sure VTube Studio is closed before proceeding.\n\n"
-            "Continue?"
+        reply = self._show_message(
+            self._warn_box,
+            "Confirm Restore",
+            _CONFIRM_RESTORE_TEXT,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
-        msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        msg.setStyleSheet("""
-            QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-            QLabel { color: #ffffff; }
-            QPushButton { background-color: #3d3d3d; color: #ffffff; }
-        """)
-        
-        if msg.exec() != QMessageBox.StandardButton.Yes:
+        
+        if reply != QMessageBox.StandardButton.Yes:
             return
         
         # Build options
@@ -448,15 +461,11 @@ class BackupRestoreWidget(QWidget):
         self.restore_progress.setRange(0, 0)  # Indeterminate
         self.restore_btn.setEnabled(False)
         
-        # Restore in thread
-        self.restore_thread = RestoreThread(
-            self.manager,
-            self.last_backup_path,
-            self.discovery.vts_root,
-            options
-        )
-        self.restore_thread.finished.connect(self.on_restore_finished)
-        self.restore_thread.error.connect(self.on_restore_error)
+        # Restore in thread (the previous run may still be unwinding after its emit)
+        self.restore_thread.wait()
+        self.restore_thread.backup_path = self.last_backup_path
+        self.restore_thread.vts_root = vts_root
+        self.restore_thread.options = options
         self.restore_thread.start()
     
     def on_restore_finished(self, report):
@@ -465,7 +474,6 @@ class BackupRestoreWidget(QWidget):
         self.restore_btn.setEnabled(True)
         
         # Show results
-        from result_dialog import RestoreResultDialog
         dialog = RestoreResultDialog(report, self)
         dialog.exec()
     
@@ -474,13 +482,4 @@ class BackupRestoreWidget(QWidget):
         self.restore_progress.setVisible(False)
         self.restore_btn.setEnabled(True)
         
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Critical)
-        msg.setWindowTitle("Restore Error")
-        msg.setText(f"An error occurred during restore:\n\n{error}")
-        msg.setStyleSheet("""
-            QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-            QLabel { color: #ffffff; }
-            QPushButton { background-color: #3d3d3d; color: #ffffff; }
-        """)
-        msg.exec()
+        self._show_message(self._err_box, "Restore Error", _RESTORE_ERR_TMPL.format(error))
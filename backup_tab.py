@@ -4,26 +4,53 @@ Backup Tab - Centralized backup and restore for VTS and OBS
 
 import logging
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 from backup_restore_widget import BackupRestoreWidget
 
 logger = logging.getLogger(__name__)
 
 
+# (category title, [(application, what a backup would cover), ...]) for planned backups
+_SECTIONS = (
+    ("🎥 Streaming Software", (
+        ("OBS Studio", "📦 Backup scenes, sources, settings, filters, and plugins"),
+        ("Streamlabs Desktop", "📦 Backup scenes, overlays, alerts, chatbot settings, and themes"),
+    )),
+    ("🎵 Audio Software", (
+        ("VoiceMeeter (Banana/Potato)", "📦 Backup audio routing, strips, buses, and macro buttons"),
+        ("Voicemod", "📦 Backup voice effects, custom voices, soundboard, and keybinds"),
+    )),
+    ("🎮 Control Software", (
+        ("Elgato Stream Deck", "📦 Backup profiles, buttons, actions, icons, and multi-actions"),
+        ("Touch Portal", "📦 Backup pages, buttons, actions, and custom plugins"),
+        ("LioranBoard", "📦 Backup decks, commands, triggers, and custom scripts"),
+    )),
+    ("🎭 VTuber Software", (
+        ("VSeeFace", "📦 Backup avatars, tracking settings, expressions, and camera configs"),
+        ("Warudo", "📦 Backup scenes, blueprints, assets, props, and settings"),
+    )),
+    ("💬 Communication & Misc", (
+        ("Discord", "📦 Backup settings, keybinds, themes, and soundboard sounds"),
+    )),
+)
+
+
 class BackupTab(QWidget):
     """Tab for managing all backups (VTS, OBS, etc.)."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        self._sections_built = False
+        
         self.setup_ui()
         logger.info("Backup tab initialized")
     
     def setup_ui(self):
-        """Setup the UI."""
+        """Setup the UI (styled by the "role" rules in styles.BACKUP_TAB_QSS)."""
         # Main layout with no margins (scroll area handles this)
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -32,23 +59,20 @@ class BackupTab(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #1e1e1e;
-            }
-        """)
+        scroll.setObjectName("backupScroll")
         
-        # Content widget
+        # Content widget (QScrollArea.setWidget turns on autoFillBackground,
+        # so it needs its own dark background rule)
         content = QWidget()
-        content.setStyleSheet("background-color: #1e1e1e;")
+        content.setObjectName("backupContent")
         layout = QVBoxLayout(content)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
         
         # Header
         header = QLabel("<h1>Backup & Restore</h1>")
-        header.setStyleSheet("color: #ffffff; background-color: transparent;")
+        header.setProperty("role", "heading")
+        header.setTextFormat(Qt.TextFormat.RichText)
         layout.addWidget(header)
         
         # Description
@@ -56,26 +80,26 @@ class BackupTab(QWidget):
             "Create and restore complete backups of your configurations.\n"
             "All backups are stored as ZIP files for easy portability."
         )
-        desc.setStyleSheet("color: #cccccc; background-color: transparent; font-size: 11pt;")
+        desc.setProperty("role", "intro")
+        desc.setTextFormat(Qt.TextFormat.PlainText)
         desc.setWordWrap(True)
         layout.addWidget(desc)
         
         # Separator
-        separator = QWidget()
-        separator.setFixedHeight(2)
-        separator.setStyleSheet("background-color: #3d3d3d;")
-        layout.addWidget(separator)
+        layout.addWidget(self._create_separator("separator"))
         
         # VTS Backup Section
         vts_header = QLabel("<h2>VTube Studio Backup</h2>")
-        vts_header.setStyleSheet("color: #ffffff; background-color: transparent;")
+        vts_header.setProperty("role", "heading")
+        vts_header.setTextFormat(Qt.TextFormat.RichText)
         layout.addWidget(vts_header)
         
         vts_desc = QLabel(
             "Backup your complete VTube Studio configuration including all models, "
             "items, settings, calibration data, and visual effects."
         )
-        vts_desc.setStyleSheet("color: #cccccc; background-color: transparent;")
+        vts_desc.setProperty("role", "description")
+        vts_desc.setTextFormat(Qt.TextFormat.PlainText)
         vts_desc.setWordWrap(True)
         layout.addWidget(vts_desc)
         
@@ -83,245 +107,12 @@ class BackupTab(QWidget):
         self.vts_backup = BackupRestoreWidget()
         layout.addWidget(self.vts_backup)
         
-        # === STREAMING SOFTWARE SECTION ===
-        streaming_separator = QWidget()
-        streaming_separator.setFixedHeight(2)
-        streaming_separator.setStyleSheet("background-color: #3d3d3d;")
-        layout.addWidget(streaming_separator)
-        
-        streaming_category = QLabel("<h2>🎥 Streaming Software</h2>")
-        streaming_category.setStyleSheet("color: #ffffff; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(streaming_category)
-        
-        # OBS Studio
-        obs_header = QLabel("<h3>OBS Studio</h3>")
-        obs_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 5px;")
-        layout.addWidget(obs_header)
-        
-        obs_placeholder = QLabel(
-            "📦 Backup scenes, sources, settings, filters, and plugins"
-        )
-        obs_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        obs_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        obs_placeholder.setWordWrap(True)
-        layout.addWidget(obs_placeholder)
-        
-        # Streamlabs Desktop
-        streamlabs_header = QLabel("<h3>Streamlabs Desktop</h3>")
-        streamlabs_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(streamlabs_header)
-        
-        streamlabs_placeholder = QLabel(
-            "📦 Backup scenes, overlays, alerts, chatbot settings, and themes"
-        )
-        streamlabs_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        streamlabs_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        streamlabs_placeholder.setWordWrap(True)
-        layout.addWidget(streamlabs_placeholder)
-        
-        # === AUDIO SOFTWARE SECTION ===
-        audio_separator = QWidget()
-        audio_separator.setFixedHeight(2)
-        audio_separator.setStyleSheet("background-color: #3d3d3d; margin-top: 15px;")
-        layout.addWidget(audio_separator)
-        
-        audio_category = QLabel("<h2>🎵 Audio Software</h2>")
-        audio_category.setStyleSheet("color: #ffffff; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(audio_category)
-        
-        # VoiceMeeter
-        voicemeeter_header = QLabel("<h3>VoiceMeeter (Banana/Potato)</h3>")
-        voicemeeter_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 5px;")
-        layout.addWidget(voicemeeter_header)
-        
-        voicemeeter_placeholder = QLabel(
-            "📦 Backup audio routing, strips, buses, and macro buttons"
-        )
-        voicemeeter_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        voicemeeter_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        voicemeeter_placeholder.setWordWrap(True)
-        layout.addWidget(voicemeeter_placeholder)
-        
-        # Voicemod
-        voicemod_header = QLabel("<h3>Voicemod</h3>")
-        voicemod_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(voicemod_header)
-        
-        voicemod_placeholder = QLabel(
-            "📦 Backup voice effects, custom voices, soundboard, and keybinds"
-        )
-        voicemod_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        voicemod_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        voicemod_placeholder.setWordWrap(True)
-        layout.addWidget(voicemod_placeholder)
-        
-        # === CONTROL SOFTWARE SECTION ===
-        control_separator = QWidget()
-        control_separator.setFixedHeight(2)
-        control_separator.setStyleSheet("background-color: #3d3d3d; margin-top: 15px;")
-        layout.addWidget(control_separator)
-        
-        control_category = QLabel("<h2>🎮 Control Software</h2>")
-        control_category.setStyleSheet("color: #ffffff; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(control_category)
-        
-        # Stream Deck
-        streamdeck_header = QLabel("<h3>Elgato Stream Deck</h3>")
-        streamdeck_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 5px;")
-        layout.addWidget(streamdeck_header)
-        
-        streamdeck_placeholder = QLabel(
-            "📦 Backup profiles, buttons, actions, icons, and multi-actions"
-        )
-        streamdeck_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        streamdeck_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        streamdeck_placeholder.setWordWrap(True)
-        layout.addWidget(streamdeck_placeholder)
-        
-        # Touch Portal
-        touchportal_header = QLabel("<h3>Touch Portal</h3>")
-        touchportal_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(touchportal_header)
-        
-        touchportal_placeholder = QLabel(
-            "📦 Backup pages, buttons, actions, and custom plugins"
-        )
-        touchportal_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        touchportal_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        touchportal_placeholder.setWordWrap(True)
-        layout.addWidget(touchportal_placeholder)
-        
-        # LioranBoard
-        lioranboard_header = QLabel("<h3>LioranBoard</h3>")
-        lioranboard_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(lioranboard_header)
-        
-        lioranboard_placeholder = QLabel(
-            "📦 Backup decks, commands, triggers, and custom scripts"
-        )
-        lioranboard_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        lioranboard_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        lioranboard_placeholder.setWordWrap(True)
-        layout.addWidget(lioranboard_placeholder)
-        
-        # === VTUBER SOFTWARE SECTION ===
-        vtuber_separator = QWidget()
-        vtuber_separator.setFixedHeight(2)
-        vtuber_separator.setStyleSheet("background-color: #3d3d3d; margin-top: 15px;")
-        layout.addWidget(vtuber_separator)
-        
-        vtuber_category = QLabel("<h2>🎭 VTuber Software</h2>")
-        vtuber_category.setStyleSheet("color: #ffffff; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(vtuber_category)
-        
-        # VSeeFace
-        vseeface_header = QLabel("<h3>VSeeFace</h3>")
-        vseeface_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 5px;")
-        layout.addWidget(vseeface_header)
-        
-        vseeface_placeholder = QLabel(
-            "📦 Backup avatars, tracking settings, expressions, and camera configs"
-        )
-        vseeface_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        vseeface_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        vseeface_placeholder.setWordWrap(True)
-        layout.addWidget(vseeface_placeholder)
-        
-        # Warudo
-        warudo_header = QLabel("<h3>Warudo</h3>")
-        warudo_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(warudo_header)
-        
-        warudo_placeholder = QLabel(
-            "📦 Backup scenes, blueprints, assets, props, and settings"
-        )
-        warudo_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        warudo_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        warudo_placeholder.setWordWrap(True)
-        layout.addWidget(warudo_placeholder)
-        
-        # === OTHER APPS SECTION ===
-        other_separator = QWidget()
-        other_separator.setFixedHeight(2)
-        other_separator.setStyleSheet("background-color: #3d3d3d; margin-top: 15px;")
-        layout.addWidget(other_separator)
-        
-        other_category = QLabel("<h2>💬 Communication & Misc</h2>")
-        other_category.setStyleSheet("color: #ffffff; background-color: transparent; margin-top: 10px;")
-        layout.addWidget(other_category)
-        
-        # Discord
-        discord_header = QLabel("<h3>Discord</h3>")
-        discord_header.setStyleSheet("color: #888888; background-color: transparent; margin-top: 5px;")
-        layout.addWidget(discord_header)
-        
-        discord_placeholder = QLabel(
-            "📦 Backup settings, keybinds, themes, and soundboard sounds"
-        )
-        discord_placeholder.setStyleSheet("""
-            color: #666666; 
-            background-color: #252525; 
-            padding: 15px; 
-            border: 2px dashed #3d3d3d;
-            border-radius: 5px;
-        """)
-        discord_placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        discord_placeholder.setWordWrap(True)
-        layout.addWidget(discord_placeholder)
+        # Placeholder sections for other software (filled in on first show)
+        self._sections_container = QWidget()
+        self._sections_layout = QVBoxLayout(self._sections_container)
+        self._sections_layout.setContentsMargins(0, 0, 0, 0)
+        self._sections_layout.setSpacing(20)
+        layout.addWidget(self._sections_container)
         
         # Spacer
         layout.addStretch()
@@ -329,3 +120,57 @@ class BackupTab(QWidget):
         # Set content to scroll area
         scroll.setWidget(content)
         main_layout.addWidget(scroll)
+    
+    def showEvent(self, event):
+        """Schedule the placeholder sections the first time the tab is shown."""
+        super().showEvent(event)
+        if not self._sections_built:
+            self._sections_built = True
+            QTimer.singleShot(0, self._build_remaining_sections)
+    
+    def _build_remaining_sections(self):
+        """Build the placeholder sections for other software."""
+        # The tab is already visible here, so hold repaints until every widget is in
+        self._sections_container.setUpdatesEnabled(False)
+        try:
+            for index, (title, entries) in enumerate(_SECTIONS):
+                self._add_section(self._sections_layout, title, entries, first=index == 0)
+        finally:
+            self._sections_container.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def _create_separator(role: str) -> QFrame:
+        """Create a 2px horizontal rule."""
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Plain)
+        separator.setLineWidth(2)
+        separator.setFixedHeight(2)
+        separator.setProperty("role", role)
+        return separator
+    
+    def _add_section(self, layout: QVBoxLayout, title: str, entries, first: bool = False):
+        """Add a category separator, header and its placeholder entries."""
+        layout.addWidget(self._create_separator("separator" if first else "sectionSeparator"))
+        
+        category = QLabel(f"<h2>{title}</h2>")
+        category.setProperty("role", "category")
+        category.setTextFormat(Qt.TextFormat.RichText)
+        layout.addWidget(category)
+        
+        for index, (header_text, body_text) in enumerate(entries):
+            self._add_placeholder(layout, header_text, body_text, first=index == 0)
+    
+    def _add_placeholder(self, layout: QVBoxLayout, header_text: str, body_text: str, first: bool = False):
+        """Add a 'coming soon' entry for a piece of software."""
+        header = QLabel(f"<h3>{header_text}</h3>")
+        header.setProperty("role", "firstAppHeading" if first else "appHeading")
+        header.setTextFormat(Qt.TextFormat.RichText)
+        layout.addWidget(header)
+        
+        placeholder = QLabel(body_text)
+        placeholder.setProperty("role", "placeholder")
+        placeholder.setTextFormat(Qt.TextFormat.PlainText)
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        placeholder.setWordWrap(True)
+        layout.addWidget(placeholder)
@@ -27,6 +27,7 @@ if %ERRORLEVEL% NEQ 0 (
 REM Copy necessary files to dist
 copy config.ini.example dist\config.ini 2>nul
 copy README.md dist\ 2>nul
+copy aika_appicon_controlPanel.png dist\ 2>nul
 
 echo.
 echo Build complete! Check the 'dist' folder for VTS-Control-Panel.exe
@@ -4,7 +4,9 @@ Simplified version of AIKA's config_utils
 """
 
 import os
+import stat
 import logging
+import tempfile
 from configparser import ConfigParser
 
 logger = logging.getLogger(__name__)
@@ -16,25 +18,52 @@ class ConfigManager:
         """Initialize config manager."""
         self.config_file = config_file
         self.config = ConfigParser()
+        self._cache = {}  # (getter, section, option) -> converted value
+        self._read_failed = False  # Set when an existing file couldn't be read
         self.load()
     
     def load(self):
         """Load configuration from file."""
-        if os.path.exists(self.config_file):
-            try:
-                self.config.read(self.config_file)
-                logger.info(f"Loaded config from {self.config_file}")
-            except Exception as e:
-                logger.error(f"Error loading config: {e}")
-                self.create_default()
-        else:
+        self._cache.clear()
+        self._read_failed = False
+        try:
+            with open(self.config_file) as f:
+                self.config.read_file(f)
+        except FileNotFoundError:
             self.create_default()
+            return
+        except Exception as e:
+            # Never overwrite a config we couldn't read; getters use their fallbacks
+            logger.error(f"Error loading config (file left unchanged): {e}")
+            self._read_failed = True
+            return
+        logger.info(f"Loaded config from {self.config_file}")
     
     def save(self):
         """Save configuration to file."""
+        if self._read_failed:
+            logger.warning(f"Not saving config: {self.config_file} could not be read")
+            return
         try:
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+            # Write to a temp file next to the config and swap it in atomically
+            config_dir = os.path.dirname(os.path.abspath(self.config_file))
+            fd, tmp_path = tempfile.mkstemp(prefix='.config_', suffix='.tmp', dir=config_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    self.config.write(f)
+                # mkstemp creates the file as 0600; keep the existing file's mode,
+                # or use the mode open() would give a new file
+                if os.path.exists(self.config_file):
+                    mode = stat.S_IMODE(os.stat(self.config_file).st_mode)
+                else:
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    mode = 0o666 & ~umask
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, self.config_file)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
             logger.info(f"Saved config to {self.config_file}")
         except Exception as e:
             logger.error(f"Error saving config: {e}")
@@ -58,33 +87,41 @@ class ConfigManager:
         self.save()
         logger.info("Created default configuration")
     
+    def _get_cached(self, getter, section: str, option: str, fallback):
+        """Get a converted value, caching it until the option changes."""
+        key = (getter.__name__, section, option)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        
+        try:
+            value = getter(section, option)
+        except Exception:
+            return fallback
+        
+        self._cache[key] = value
+        return value
+    
     def get_string(self, section: str, option: str, fallback: str = '') -> str:
         """Get string value from config."""
-        return self.config.get(section, option, fallback=fallback)
+        return self._get_cached(self.config.get, section, option, fallback)
     
     def get_int(self, section: str, option: str, fallback: int = 0) -> int:
         """Get integer value from config."""
-        try:
-            return self.config.getint(section, option, fallback=fallback)
-        except:
-            return fallback
+        return self._get_cached(self.config.getint, section, option, fallback)
     
     def get_float(self, section: str, option: str, fallback: float = 0.0) -> float:
         """Get float value from config."""
-        try:
-            return self.config.getfloat(section, option, fallback=fallback)
-        except:
-            return fallback
+        return self._get_cached(self.config.getfloat, section, option, fallback)
     
     def get_bool(self, section: str, option: str, fallback: bool = False) -> bool:
         """Get boolean value from config."""
-        try:
-            return self.config.getboolean(section, option, fallback=fallback)
-        except:
-            return fallback
+        return self._get_cached(self.config.getboolean, section, option, fallback)
     
     def set_value(self, section: str, option: str, value):
         """Set value in config."""
         if not self.config.has_section(section):
             self.config.add_section(section)
         self.config.set(section, option, str(value))
+        self._cache.clear()
@@ -6,17 +6,24 @@ Simplified version of AIKA's VTS functionality
 import sys
 import os
 import logging
-import asyncio
 from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QMessageBox
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QIcon
 
+# Application directory (next to exe or script)
+if getattr(sys, 'frozen', False):
+    # Running as exe
+    APP_DIR = os.path.dirname(sys.executable)
+else:
+    # Running as script
+    APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('vts_control_panel.log', encoding='utf-8'),
+        logging.FileHandler(os.path.join(APP_DIR, 'vts_control_panel.log'), encoding='utf-8', delay=True),
         logging.StreamHandler()
     ]
 )
@@ -31,10 +38,8 @@ if sys.platform == 'win32':
 
 logger = logging.getLogger(__name__)
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config_manager import ConfigManager
+from styles import GLOBAL_QSS
 from vts_params_tab import VTSParamsTab
 from vts_settings_tab import VTSSettingsTab
 from vts_model_manager_tab import VTSModelManagerTab
@@ -46,23 +51,18 @@ class VTSControlPanel(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Determine config path (next to exe or script)
-        if getattr(sys, 'frozen', False):
-            # Running as exe
-            self.app_dir = os.path.dirname(sys.executable)
-        else:
-            # Running as script
-            self.app_dir = os.path.dirname(os.path.abspath(__file__))
+        self.app_dir = APP_DIR
         
+        # Backup, profile and parameter files still default to the working directory
         os.chdir(self.app_dir)
         logger.info(f"Working directory: {self.app_dir}")
         
         # Initialize config
-        self.config_manager = ConfigManager('config.ini')
+        self.config_manager = ConfigManager(os.path.join(self.app_dir, 'config.ini'))
         
         # Setup UI
         self.setWindowTitle("VTS Control Panel")
-        self.setWindowIcon(QIcon())  # TODO: Add icon
+        self.setWindowIcon(QIcon(os.path.join(APP_DIR, 'aika_appicon_controlPanel.png')))
         
         # Restore window geometry
         self.restore_geometry()
@@ -74,7 +74,7 @@ class VTSControlPanel(QMainWindow):
         # Create tabs
         self.settings_tab = VTSSettingsTab(self.config_manager)
         self.params_tab = VTSParamsTab(self.config_manager, self.settings_tab.vts_service)
-        self.model_manager_tab = VTSModelManagerTab()
+        self.model_manager_tab = VTSModelManagerTab(self.config_manager)
         self.backup_tab = BackupTab()
         
         # Add tabs
@@ -83,35 +83,8 @@ class VTSControlPanel(QMainWindow):
         self.tabs.addTab(self.backup_tab, "Backup & Restore")
         self.tabs.addTab(self.settings_tab, "Settings")
         
-        # Apply theme
-        self.apply_theme()
-        
         logger.info("VTS Control Panel initialized")
     
-    def apply_theme(self):
-        """Apply dark theme."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QTabWidget::pane {
-                border: 1px solid #3d3d3d;
-                background-color: #252525;
-            }
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                padding: 8px 20px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #007acc;
-            }
-            QTabBar::tab:hover {
-                background-color: #3d3d3d;
-            }
-        """)
-    
     def restore_geometry(self):
         """Restore window geometry from config."""
         width = self.config_manager.get_int('UI', 'window_width', 900)
@@ -145,6 +118,7 @@ def main():
     """Main entry point."""
     app = QApplication(sys.argv)
     app.setApplicationName("VTS Control Panel")
+    app.setStyleSheet(GLOBAL_QSS)
     
     window = VTSControlPanel()
     window.show()
@@ -2,6 +2,7 @@
 Model Rename Dialog - Rename or duplicate VTS models properly
 """
 
+import functools
 import logging
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
@@ -9,8 +10,48 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
+from model_renamer import INVALID_NAME_CHARS, INVALID_NAME_CHAR_SET
+from styles import styled_message_box
+
 logger = logging.getLogger(__name__)
 
+_INVALID_CHARS_ERROR = "Model name cannot contain: " + " ".join(INVALID_NAME_CHARS)
+
+_GROUP_QSS = """
+    QGroupBox {
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #2d2d2d;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+"""
+
+
+@functools.cache
+def _button_qss(background: str, hover: str, bold: bool = False) -> str:
+    """Dialog button stylesheet for a color pair (one string object per combination)."""
+    weight = "bold" if bold else "normal"
+    return f"""
+    QPushButton {{
+        background-color: {background};
+        color: #ffffff;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 3px;
+        font-weight: {weight};
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+"""
+
 
 class ModelRenameDialog(QDialog):
     """Dialog for renaming/duplicating models."""
@@ -21,6 +62,7 @@ class ModelRenameDialog(QDialog):
         self.current_name = current_name
         self.new_name = ""
         self.create_new_id = False
+        self._error_box = None
         
         self.setup_ui()
         self.apply_dark_theme()
@@ -47,21 +89,7 @@ class ModelRenameDialog(QDialog):
         
         # Current name
         current_group = QGroupBox("Current Name")
-        current_group.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #2d2d2d;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        current_group.setStyleSheet(_GROUP_QSS)
         current_layout = QVBoxLayout(current_group)
         
         current_label = QLabel(self.current_name)
@@ -72,21 +100,7 @@ class ModelRenameDialog(QDialog):
         
         # New name
         new_group = QGroupBox("New Name")
-        new_group.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #2d2d2d;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        new_group.setStyleSheet(_GROUP_QSS)
         new_layout = QVBoxLayout(new_group)
         
         self.name_edit = QLineEdit()
@@ -109,21 +123,7 @@ class ModelRenameDialog(QDialog):
         
         # Options
         options_group = QGroupBox("Options")
-        options_group.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #2d2d2d;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        options_group.setStyleSheet(_GROUP_QSS)
         options_layout = QVBoxLayout(options_group)
         
         self.new_id_check = QCheckBox("Create new Model ID (duplicate as separate model)")
@@ -155,35 +155,12 @@ class ModelRenameDialog(QDialog):
         button_layout.addStretch()
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        cancel_btn.setStyleSheet(_button_qss("#3d3d3d", "#4d4d4d"))
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
         rename_btn = QPushButton("Rename Model")
-        rename_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0098ff;
-            }
-        """)
+        rename_btn.setStyleSheet(_button_qss("#007acc", "#0098ff", bold=True))
         rename_btn.clicked.connect(self.accept_rename)
         button_layout.addWidget(rename_btn)
         
@@ -200,49 +177,30 @@ class ModelRenameDialog(QDialog):
             }
         """)
     
+    def _show_error(self, title: str, text: str):
+        """Show a validation error, reusing one message box for the dialog."""
+        if self._error_box is None:
+            self._error_box = styled_message_box(self, QMessageBox.Icon.Warning, title, text)
+        else:
+            self._error_box.setWindowTitle(title)
+            self._error_box.setText(text)
+        self._error_box.exec()
+    
     def accept_rename(self):
         """Accept and validate."""
         new_name = self.name_edit.text().strip()
         
         if not new_name:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Invalid Name")
-            msg.setText("Please enter a new model name.")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; }
-            """)
-            msg.exec()
+            self._show_error("Invalid Name", "Please enter a new model name.")
             return
         
         if new_name == self.current_name:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Same Name")
-            msg.setText("The new name is the same as the current name.")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; }
-            """)
-            msg.exec()
+            self._show_error("Same Name", "The new name is the same as the current name.")
             return
         
         # Check for invalid characters
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        if any(char in new_name for char in invalid_chars):
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Invalid Characters")
-            msg.setText(f"Model name cannot contain: {' '.join(invalid_chars)}")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; }
-            """)
-            msg.exec()
+        if not INVALID_NAME_CHAR_SET.isdisjoint(new_name):
+            self._show_error("Invalid Characters", _INVALID_CHARS_ERROR)
             return
         
         self.new_name = new_name
@@ -4,9 +4,10 @@ Model Renamer - Properly rename/duplicate VTS models
 
 import json
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -14,6 +15,43 @@ from vts_file_parser import VTSFileParser
 
 logger = logging.getLogger(__name__)
 
+# Filename fragments marking backups and copies rather than the live config
+_NON_PRIMARY_MARKERS = ('.original', '.backup', ' - Kopie')
+
+# Characters not allowed in model (folder/file) names (Windows filename rules);
+# model_rename_dialog validates against the same set
+INVALID_NAME_CHARS = '<>:"/\\|?*'
+INVALID_NAME_CHAR_SET = frozenset(INVALID_NAME_CHARS)
+
+
+def _is_primary_vtube(path: Path) -> bool:
+    """Check that a .vtube.json path is not a backup or copy."""
+    name = path.name
+    return not any(marker in name for marker in _NON_PRIMARY_MARKERS)
+
+
+def _write_config(path: Path, config: dict, pretty: bool = True):
+    """
+    Write a .vtube.json config atomically.
+    
+    The config is encoded in one pass, written to a sibling temp file and
+    moved over the destination with os.replace, so an interrupted write
+    never leaves a truncated .vtube.json behind. With pretty=False the
+    JSON is written compactly, which is faster to encode and smaller.
+    """
+    if pretty:
+        text = json.dumps(config, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(config, ensure_ascii=False, separators=(',', ':'))
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 @dataclass
 class RenameResult:
@@ -33,10 +71,34 @@ class RenameResult:
 class ModelRenamer:
     """Handles proper model renaming and duplication."""
     
-    def __init__(self):
-        self.parser = VTSFileParser()
+    def __init__(self, pretty_json: bool = True):
+        """
+        Initialize the renamer.
+        
+        Args:
+            pretty_json: Write renamed .vtube.json files indented (False = compact)
+        """
+        self.pretty_json = pretty_json
+        # Model folder -> (folder mtime_ns, .vtube.json candidates)
+        self._vtube_cache: Dict[Path, Tuple[int, List[Path]]] = {}
         logger.info("ModelRenamer initialized")
     
+    def _list_vtube_files(self, model_folder: Path) -> List[Path]:
+        """
+        List the model's .vtube.json files, excluding backups and copies.
+        
+        The result is cached until the folder's mtime changes, so a
+        validate_rename followed by rename_model scans the folder once.
+        """
+        mtime_ns = model_folder.stat().st_mtime_ns
+        cached = self._vtube_cache.get(model_folder)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        vtube_files = [f for f in model_folder.glob("*.vtube.json") if _is_primary_vtube(f)]
+        self._vtube_cache[model_folder] = (mtime_ns, vtube_files)
+        return vtube_files
+    
     def rename_model(
         self,
         model_folder: Path,
@@ -63,12 +125,7 @@ class ModelRenamer:
                 return result
             
             # Find .vtube.json file
-            vtube_files = list(model_folder.glob("*.vtube.json"))
-            # Filter out backups
-            vtube_files = [f for f in vtube_files 
-                          if '.original' not in f.name 
-                          and '.backup' not in f.name
-                          and ' - Kopie' not in f.name]
+            vtube_files = self._list_vtube_files(model_folder)
             
             if not vtube_files:
                 result.error = "No .vtube.json file found in model folder"
@@ -87,7 +144,7 @@ class ModelRenamer:
             result.changes_made.append(f"Created backup: {backup_path.name}")
             
             # Load current config
-            config = self.parser.load_vtube_json(old_vtube_file)
+            config = VTSFileParser.load_vtube_json(old_vtube_file)
             if not config:
                 result.error = f"Failed to load .vtube.json: {old_vtube_file}"
                 return result
@@ -101,7 +158,7 @@ class ModelRenamer:
             # Generate new ModelID if requested
             if create_new_id:
                 old_model_id = config.get('ModelID', '')
-                new_model_id = self.parser.generate_uuid()
+                new_model_id = VTSFileParser.generate_uuid()
                 config['ModelID'] = new_model_id
                 result.changes_made.append(f"Generated new ModelID: {new_model_id[:8]}...")
                 logger.info(f"Generated new ModelID: {old_model_id[:8]}... → {new_model_id[:8]}...")
@@ -115,8 +172,7 @@ class ModelRenamer:
                 return result
             
             # Write updated config
-            with open(new_vtube_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _write_config(new_vtube_path, config, self.pretty_json)
             
             result.changes_made.append(f"Created new .vtube.json: {new_vtube_filename}")
             logger.info(f"Saved new .vtube.json: {new_vtube_path.name}")
@@ -135,12 +191,12 @@ class ModelRenamer:
                 # Restore old file
                 if old_vtube_file != new_vtube_path:
                     new_vtube_path.unlink()
-                    with open(old_vtube_file, 'w', encoding='utf-8') as f:
-                        json.dump(config, f, indent=2, ensure_ascii=False)
+                    _write_config(old_vtube_file, config, self.pretty_json)
                 return result
             
             if model_folder != new_folder_path:
                 model_folder.rename(new_folder_path)
+                self._vtube_cache.pop(model_folder, None)
                 result.changes_made.append(f"Renamed folder: '{model_folder.name}' → '{new_name}'")
                 logger.info(f"Renamed folder: {model_folder.name} → {new_name}")
                 result.new_path = new_folder_path
@@ -193,11 +249,7 @@ class ModelRenamer:
             return False, "Model folder not found"
         
         # Check for .vtube.json
-        vtube_files = list(model_folder.glob("*.vtube.json"))
-        vtube_files = [f for f in vtube_files 
-                      if '.original' not in f.name 
-                      and '.backup' not in f.name
-                      and ' - Kopie' not in f.name]
+        vtube_files = self._list_vtube_files(model_folder)
         
         if not vtube_files:
             return False, "No .vtube.json file found"
@@ -210,9 +262,9 @@ class ModelRenamer:
             return False, "New name cannot be empty"
         
         # Check for invalid characters
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        if any(char in new_name for char in invalid_chars):
-            return False, f"Name contains invalid characters: {' '.join(invalid_chars)}"
+        bad_chars = INVALID_NAME_CHAR_SET.intersection(new_name)
+        if bad_chars:
+            return False, f"Name contains invalid characters: {' '.join(sorted(bad_chars))}"
         
         # Check if target folder/file already exists
         new_folder_path = model_folder.parent / new_name
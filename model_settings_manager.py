@@ -2,11 +2,15 @@
 Model Settings Manager - Manages model settings transfer operations
 """
 
+import copy
+import hashlib
 import json
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -14,6 +18,39 @@ from vts_file_parser import VTSFileParser, HotkeyInfo, ParameterInfo, Validation
 
 logger = logging.getLogger(__name__)
 
+# Parallel copies when transferring expression/animation files
+EXPRESSION_COPY_WORKERS = 4
+
+# Sidecar in the backup dir mapping each backed-up file to its latest backup
+BACKUP_INDEX_NAME = ".index.json"
+
+
+def _list_model_files(model_folder: Path) -> Set[str]:
+    """
+    List every file below a model folder in a single walk.
+    
+    Returns:
+        Set of relative paths, normalized with os.path.normcase so they can
+        be compared against normcase'd hotkey file references
+    """
+    files = set()
+    for dirpath, _dirnames, filenames in os.walk(model_folder):
+        rel_dir = os.path.relpath(dirpath, model_folder)
+        for name in filenames:
+            rel_path = name if rel_dir == '.' else os.path.join(rel_dir, name)
+            files.add(os.path.normcase(rel_path))
+    return files
+
+
+def _scan_file_names(folder: Path) -> Set[str]:
+    """Return the normcase'd names of the files directly inside a folder."""
+    try:
+        with os.scandir(folder) as entries:
+            return {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+    except OSError:
+        # Missing folder (e.g. a target subdirectory not created yet)
+        return set()
+
 
 @dataclass
 class TransferSettings:
@@ -51,6 +88,9 @@ class TransferResult:
     parameters_added: int = 0
     files_copied: int = 0
     
+    # Files referenced by the hotkeys added in this transfer
+    hotkey_files: Set[str] = field(default_factory=set)
+    
     # Issues
     warnings: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
@@ -78,6 +118,11 @@ class TransferResult:
         """Add a log message."""
         self.detailed_log.append(message)
         logger.info(message)
+    
+    def add_detail(self, message: str):
+        """Add a per-item log message (only logged at DEBUG level)."""
+        self.detailed_log.append(message)
+        logger.debug(message)
 
 
 class ModelSettingsManager:
@@ -116,22 +161,55 @@ class ModelSettingsManager:
             # Determine backup filename
             if backup_type == "original":
                 backup_path = vtube_json_path.with_suffix('.json.original')
-            else:
-                # Timestamped backup
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_name = f"{vtube_json_path.stem}.backup_{timestamp}.json"
-                backup_path = self.backup_dir / backup_name
+                shutil.copy2(vtube_json_path, backup_path)
+                logger.info(f"✓ Created backup: {backup_path.name}")
+                return backup_path
+            
+            # Timestamped backup: reuse the last one if the content is unchanged
+            digest = hashlib.blake2b(vtube_json_path.read_bytes(), digest_size=16).hexdigest()
+            index = self._load_backup_index()
+            key = str(vtube_json_path.resolve())
+            entry = index.get(key)
+            if entry and entry.get('digest') == digest:
+                existing = self.backup_dir / entry.get('backup', '')
+                if existing.is_file():
+                    logger.info(f"✓ Unchanged since last backup, reusing: {existing.name}")
+                    return existing
+            
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_name = f"{vtube_json_path.stem}.backup_{timestamp}.json"
+            backup_path = self.backup_dir / backup_name
             
             # Copy the file
             shutil.copy2(vtube_json_path, backup_path)
             logger.info(f"✓ Created backup: {backup_path.name}")
             
+            index[key] = {'digest': digest, 'backup': backup_name}
+            self._save_backup_index(index)
+            
             return backup_path
             
         except Exception as e:
             logger.error(f"Failed to create backup: {e}")
             return None
     
+    def _load_backup_index(self) -> Dict[str, Dict[str, str]]:
+        """Load the backup index (empty if missing or unreadable)."""
+        try:
+            with open(self.backup_dir / BACKUP_INDEX_NAME, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_backup_index(self, index: Dict[str, Dict[str, str]]):
+        """Save the backup index; failures only cost future deduplication."""
+        try:
+            with open(self.backup_dir / BACKUP_INDEX_NAME, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not update backup index: {e}")
+    
     def restore_backup(self, backup_path: Path, target_path: Path) -> bool:
         """
         Restore a backup file.
@@ -173,23 +251,38 @@ class ModelSettingsManager:
         Returns:
             ValidationResult with any errors/warnings
         """
+        return self._load_and_validate(source_path, target_path, settings)[0]
+    
+    def _load_and_validate(
+        self,
+        source_path: Path,
+        target_path: Path,
+        settings: TransferSettings
+    ) -> Tuple[ValidationResult, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Load both model configs and validate the transfer.
+        
+        Returns:
+            Tuple of (ValidationResult, source data, target data); the data
+            entries are None if loading stopped before they were read
+        """
         result = ValidationResult(valid=True)
         
         # Check source exists
         if not source_path.exists():
             result.add_error(f"Source file not found: {source_path}")
-            return result
+            return result, None, None
         
         # Check target exists
         if not target_path.exists():
             result.add_error(f"Target file not found: {target_path}")
-            return result
+            return result, None, None
         
         # Load and validate source
         source_data = VTSFileParser.load_vtube_json(source_path)
         if not source_data:
             result.add_error("Failed to load source model config")
-            return result
+            return result, None, None
         
         source_validation = VTSFileParser.validate_vtube_json(source_data)
         if not source_validation.valid:
@@ -201,7 +294,7 @@ class ModelSettingsManager:
         target_data = VTSFileParser.load_vtube_json(target_path)
         if not target_data:
             result.add_error("Failed to load target model config")
-            return result
+            return result, source_data, None
         
         target_validation = VTSFileParser.validate_vtube_json(target_data)
         if not target_validation.valid:
@@ -216,24 +309,26 @@ class ModelSettingsManager:
             
             # Filter to selected hotkeys if not transferring all
             if not settings.transfer_all_hotkeys and settings.selected_hotkey_ids:
+                selected_ids = set(settings.selected_hotkey_ids)
                 source_hotkeys = [
                     hk for hk in source_hotkeys 
-                    if hk.hotkey_id in settings.selected_hotkey_ids
+                    if hk.hotkey_id in selected_ids
                 ]
             
             file_validation = VTSFileParser.validate_file_references(source_hotkeys, source_folder)
             for warning in file_validation.warnings:
                 result.add_warning(warning)
         
-        return result
+        return result, source_data, target_data
     
     def transfer_hotkeys(
         self,
         source_data: Dict[str, Any],
         target_data: Dict[str, Any],
-        hotkey_ids: List[str],
+        hotkey_ids: Optional[Iterable[str]] = None,
         generate_new_ids: bool = True,
-        target_model_folder: Optional[Path] = None
+        target_model_folder: Optional[Path] = None,
+        parent: Optional[TransferResult] = None
     ) -> TransferResult:
         """
         Transfer hotkeys from source to target.
@@ -244,39 +339,48 @@ class ModelSettingsManager:
         Args:
             source_data: Source model data
             target_data: Target model data
-            hotkey_ids: List of hotkey IDs to transfer
+            hotkey_ids: Hotkey IDs to transfer (None transfers all)
             generate_new_ids: Whether to generate new UUIDs
             target_model_folder: Path to target model folder (for checking files)
+            parent: Result to record into directly instead of a new one
             
         Returns:
-            TransferResult with operation details
+            TransferResult with operation details (parent, if given)
         """
-        result = TransferResult(success=True)
+        result = parent if parent is not None else TransferResult(success=True)
         
         source_hotkeys = source_data.get('Hotkeys', [])
         target_hotkeys = target_data.get('Hotkeys', [])
         
         # Filter source hotkeys to only selected ones
-        hotkeys_to_transfer = [
-            hk for hk in source_hotkeys
-            if hk.get('HotkeyID') in hotkey_ids
-        ]
+        if hotkey_ids is None:
+            hotkeys_to_transfer = source_hotkeys
+        else:
+            selected_ids = set(hotkey_ids)
+            hotkeys_to_transfer = [
+                hk for hk in source_hotkeys
+                if hk.get('HotkeyID') in selected_ids
+            ]
         
         if not hotkeys_to_transfer:
             result.add_warning("No hotkeys matched the selection")
             return result
         
-        # Transfer each hotkey
+        # Scan the target model once instead of stat'ing every referenced file
+        target_files = _list_model_files(target_model_folder) if target_model_folder else None
+        
+        # Transfer each hotkey (hot loop: bind the per-hotkey helpers locally)
+        deepcopy = copy.deepcopy
+        generate_uuid = VTSFileParser.generate_uuid
+        add_detail = result.add_detail
         skipped = []
         for hotkey in hotkeys_to_transfer:
             hotkey_name = hotkey.get('Name', 'Unknown')
             file_ref = hotkey.get('File', '')
             
             # Check if expression file exists in target model (if file is required)
-            if file_ref and target_model_folder:
-                target_file = target_model_folder / file_ref
-                
-                if not target_file.exists():
+            if file_ref and target_files is not None:
+                if os.path.normcase(os.path.normpath(file_ref)) not in target_files:
                     # Skip this hotkey - target model doesn't have the expression
                     skipped.append({
                         'name': hotkey_name,
@@ -289,18 +393,19 @@ class ModelSettingsManager:
                     continue
             
             # Deep copy the hotkey data
-            new_hotkey = json.loads(json.dumps(hotkey))
+            new_hotkey = deepcopy(hotkey)
             
             # Generate new UUID if requested
             if generate_new_ids:
-                old_id = new_hotkey['HotkeyID']
-                new_id = VTSFileParser.generate_uuid()
-                new_hotkey['HotkeyID'] = new_id
-                result.add_log(f"✓ '{new_hotkey['Name']}': {old_id[:8]}... → {new_id[:8]}...")
+                old_id = hotkey.get('HotkeyID', '')
+                new_id = new_hotkey['HotkeyID'] = generate_uuid()
+                add_detail(f"✓ '{hotkey_name}': {old_id[:8]}... → {new_id[:8]}...")
             
             # Add to target
             target_hotkeys.append(new_hotkey)
             result.hotkeys_added += 1
+            if file_ref:
+                result.hotkey_files.add(file_ref)
         
         # Update target data
         target_data['Hotkeys'] = target_hotkeys
@@ -322,7 +427,8 @@ class ModelSettingsManager:
         self,
         source_data: Dict[str, Any],
         target_data: Dict[str, Any],
-        parameter_names: List[str]
+        parameter_names: Optional[Iterable[str]] = None,
+        parent: Optional[TransferResult] = None
     ) -> TransferResult:
         """
         Transfer parameter mappings from source to target.
@@ -330,35 +436,41 @@ class ModelSettingsManager:
         Args:
             source_data: Source model data
             target_data: Target model data
-            parameter_names: List of parameter names to transfer
+            parameter_names: Parameter names to transfer (None transfers all)
+            parent: Result to record into directly instead of a new one
             
         Returns:
-            TransferResult with operation details
+            TransferResult with operation details (parent, if given)
         """
-        result = TransferResult(success=True)
+        result = parent if parent is not None else TransferResult(success=True)
         
         source_params = source_data.get('ParameterSettings', [])
         target_params = target_data.get('ParameterSettings', [])
         
         # Filter source parameters to only selected ones
-        params_to_transfer = [
-            param for param in source_params
-            if param.get('Name') in parameter_names
-        ]
+        if parameter_names is None:
+            params_to_transfer = source_params
+        else:
+            selected_names = set(parameter_names)
+            params_to_transfer = [
+                param for param in source_params
+                if param.get('Name') in selected_names
+            ]
         
         if not params_to_transfer:
             result.add_warning("No parameters matched the selection")
             return result
         
         # Transfer each parameter
+        add_detail = result.add_detail
         for param in params_to_transfer:
             # Deep copy the parameter data
-            new_param = json.loads(json.dumps(param))
+            new_param = copy.deepcopy(param)
             
             # Add to target
             target_params.append(new_param)
             result.parameters_added += 1
-            result.add_log(f"Parameter '{new_param['Name']}': {new_param['Input']} → {new_param['OutputLive2D']}")
+            add_detail(f"Parameter '{new_param['Name']}': {new_param['Input']} → {new_param['OutputLive2D']}")
         
         # Update target data
         target_data['ParameterSettings'] = target_params
@@ -370,7 +482,9 @@ class ModelSettingsManager:
         self,
         source_folder: Path,
         target_folder: Path,
-        expression_files: List[str]
+        expression_files: List[str],
+        preserve_times: bool = False,
+        parent: Optional[TransferResult] = None
     ) -> TransferResult:
         """
         Copy expression and animation files from source to target.
@@ -379,38 +493,79 @@ class ModelSettingsManager:
             source_folder: Source model folder
             target_folder: Target model folder
             expression_files: List of filenames to copy
+            preserve_times: Whether to copy access/modification times too
+            parent: Result to record into directly instead of a new one
             
         Returns:
-            TransferResult with operation details
+            TransferResult with operation details (parent, if given)
         """
-        result = TransferResult(success=True)
+        result = parent if parent is not None else TransferResult(success=True)
+        created_dirs = set()
+        pending = []
+        # One directory listing per folder involved instead of two stats per file
+        listings: Dict[Path, Set[str]] = {}
+        
+        def folder_files(folder: Path) -> Set[str]:
+            names = listings.get(folder)
+            if names is None:
+                names = listings[folder] = _scan_file_names(folder)
+            return names
         
         for filename in expression_files:
             try:
                 source_file = source_folder / filename
                 target_file = target_folder / filename
+                name_key = os.path.normcase(target_file.name)
                 
-                # Create target subdirectory if needed
-                target_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                if not source_file.exists():
+                if name_key not in folder_files(source_file.parent):
                     result.add_warning(f"Source file not found: {filename}")
                     continue
                 
-                if target_file.exists():
+                if name_key in folder_files(target_file.parent):
                     result.add_warning(f"Target file already exists (skipping): {filename}")
                     continue
                 
-                # Copy the file
-                shutil.copy2(source_file, target_file)
-                result.files_copied += 1
-                result.add_log(f"✓ Copied: {filename}")
+                # Create target subdirectory if needed (once per directory)
+                target_dir = target_file.parent
+                if target_dir not in created_dirs:
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target_dir)
+                
+                folder_files(target_dir).add(name_key)
+                pending.append((filename, source_file, target_file))
                 
             except Exception as e:
                 result.add_error(f"Failed to copy {filename}: {e}")
         
+        if not pending:
+            return result
+        
+        # Copy concurrently, but report in the original order
+        workers = min(EXPRESSION_COPY_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (filename, executor.submit(self._copy_file, source_file, target_file, preserve_times))
+                for filename, source_file, target_file in pending
+            ]
+            for filename, future in futures:
+                try:
+                    future.result()
+                    result.files_copied += 1
+                    result.add_detail(f"✓ Copied: {filename}")
+                except Exception as e:
+                    result.add_error(f"Failed to copy {filename}: {e}")
+        
         return result
     
+    @staticmethod
+    def _copy_file(source_file: Path, target_file: Path, preserve_times: bool):
+        """Copy one file's contents (and optionally its timestamps)."""
+        # copyfile skips copystat and uses the OS fast path where available
+        shutil.copyfile(source_file, target_file)
+        if preserve_times:
+            source_stat = source_file.stat()
+            os.utime(target_file, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    
     def execute_transfer(
         self,
         source_path: Path,
@@ -433,7 +588,9 @@ class ModelSettingsManager:
         try:
             # Phase 1: Validate
             result.add_log("=== Phase 1: Validation ===")
-            validation = self.validate_transfer(source_path, target_path, settings)
+            validation, source_data, target_data = self._load_and_validate(
+                source_path, target_path, settings
+            )
             if not validation.valid:
                 result.success = False
                 for error in validation.errors:
@@ -443,96 +600,77 @@ class ModelSettingsManager:
             for warning in validation.warnings:
                 result.add_warning(warning)
             
-            # Phase 2: Backup
-            if settings.create_backup and not settings.dry_run:
-                result.add_log("=== Phase 2: Backup ===")
-                backup_path = self.create_backup(target_path, "timestamped")
-                if backup_path:
-                    result.backup_path = backup_path
-                    result.undo_backup_path = backup_path
-                    result.can_undo = True
-                else:
-                    result.add_error("Failed to create backup")
-                    return result
-            
-            # Phase 3: Load data
-            result.add_log("=== Phase 3: Load Data ===")
-            source_data = VTSFileParser.load_vtube_json(source_path)
-            target_data = VTSFileParser.load_vtube_json(target_path)
-            
+            # Phase 2: Load data (already parsed during validation)
+            result.add_log("=== Phase 2: Load Data ===")
             if not source_data or not target_data:
                 result.add_error("Failed to load model data")
                 return result
             
-            # Phase 4: Transfer operations
-            result.add_log("=== Phase 4: Transfer ===")
+            # Phase 3: Transfer operations
+            result.add_log("=== Phase 3: Transfer ===")
             
             # Transfer hotkeys
             if settings.transfer_all_hotkeys or settings.selected_hotkey_ids:
-                # Determine which hotkeys to transfer
-                if settings.transfer_all_hotkeys:
-                    hotkey_ids = [hk.get('HotkeyID') for hk in source_data.get('Hotkeys', [])]
-                else:
-                    hotkey_ids = settings.selected_hotkey_ids
+                # Determine which hotkeys to transfer (None = all)
+                hotkey_ids = None if settings.transfer_all_hotkeys else settings.selected_hotkey_ids
                 
                 # Get target model folder for expression file checking
                 target_model_folder = target_path.parent
                 
-                hotkey_result = self.transfer_hotkeys(
+                self.transfer_hotkeys(
                     source_data,
                     target_data,
                     hotkey_ids,
                     settings.generate_new_ids,
-                    target_model_folder
+                    target_model_folder,
+                    parent=result
                 )
-                
-                result.hotkeys_added = hotkey_result.hotkeys_added
-                result.warnings.extend(hotkey_result.warnings)
-                result.errors.extend(hotkey_result.errors)
-                result.detailed_log.extend(hotkey_result.detailed_log)
             
             # Transfer parameters
             if settings.transfer_all_parameters or settings.selected_parameter_names:
-                # Determine which parameters to transfer
-                if settings.transfer_all_parameters:
-                    param_names = [p.get('Name') for p in source_data.get('ParameterSettings', [])]
-                else:
-                    param_names = settings.selected_parameter_names
+                # Determine which parameters to transfer (None = all)
+                param_names = None if settings.transfer_all_parameters else settings.selected_parameter_names
                 
-                param_result = self.transfer_parameters(
+                self.transfer_parameters(
                     source_data,
                     target_data,
-                    param_names
+                    param_names,
+                    parent=result
                 )
-                
-                result.parameters_added = param_result.parameters_added
-                result.warnings.extend(param_result.warnings)
-                result.errors.extend(param_result.errors)
-                result.detailed_log.extend(param_result.detailed_log)
+            
+            # Phase 4: Backup, before anything is written to the target model
+            # (only when the in-memory transfer actually changed its config)
+            config_changed = result.hotkeys_added > 0 or result.parameters_added > 0
+            if settings.create_backup and not settings.dry_run and config_changed:
+                result.add_log("=== Phase 4: Backup ===")
+                backup_path = self.create_backup(target_path, "timestamped")
+                if backup_path:
+                    result.backup_path = backup_path
+                    result.undo_backup_path = backup_path
+                    result.can_undo = True
+                else:
+                    result.add_error("Failed to create backup")
+                    return result
             
             # Copy expression files
-            if settings.copy_expression_files and (settings.transfer_all_hotkeys or settings.selected_hotkey_ids):
-                # Collect all referenced files from transferred hotkeys
-                expression_files = set()
-                for hotkey in target_data.get('Hotkeys', []):
-                    file = hotkey.get('File', '')
-                    if file:
-                        expression_files.add(file)
-                
-                if expression_files:
-                    file_result = self.copy_expression_files(
-                        source_path.parent,
-                        target_path.parent,
-                        list(expression_files)
-                    )
-                    
-                    result.files_copied = file_result.files_copied
-                    result.warnings.extend(file_result.warnings)
-                    result.errors.extend(file_result.errors)
-                    result.detailed_log.extend(file_result.detailed_log)
-            
-            # Phase 5: Save (if not dry run)
-            if not settings.dry_run:
+            if settings.copy_expression_files and result.hotkey_files:
+                # Only the files referenced by hotkeys added in this transfer.
+                # Copy errors are reported but don't fail the transfer itself.
+                succeeded = result.success
+                self.copy_expression_files(
+                    source_path.parent,
+                    target_path.parent,
+                    sorted(result.hotkey_files),
+                    parent=result
+                )
+                result.success = succeeded
+            
+            # Phase 5: Save (if not dry run and the target config changed)
+            if settings.dry_run:
+                result.add_log("=== Dry Run Complete (no changes made) ===")
+            elif not config_changed:
+                result.add_log("No changes made")
+            else:
                 result.add_log("=== Phase 5: Save ===")
                 if VTSFileParser.save_vtube_json(target_path, target_data):
                     result.add_log("✓ Transfer completed successfully")
@@ -546,8 +684,6 @@ class ModelSettingsManager:
                         else:
                             result.add_error("✗ Rollback failed")
                     return result
-            else:
-                result.add_log("=== Dry Run Complete (no changes made) ===")
             
             # Create summary
             summary_parts = []
@@ -2,23 +2,91 @@
 Preview Dialog - Shows what will be transferred before applying
 """
 
+import io
 import logging
-from typing import List
+import os
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QGroupBox
+    QPlainTextEdit, QPlainTextDocumentLayout, QGroupBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont, QTextDocument
 
 from vts_discovery import ModelInfo
-from vts_file_parser import VTSFileParser
-from model_settings_manager import TransferSettings, ModelSettingsManager
+from vts_file_parser import VTSFileParser, HotkeyInfo, ParameterInfo
+from model_settings_manager import TransferSettings
 
 logger = logging.getLogger(__name__)
 
+# Whole-dialog stylesheet; child widgets are selected by object name
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+    }
+    QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QLabel#previewHeader {
+        color: #ffffff;
+        font-size: 16px;
+        background-color: #2d2d2d;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QLabel#modelInfo {
+        color: #cccccc;
+        background-color: #2d2d2d;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QLabel#previewNote {
+        color: #ffaa00;
+        background-color: #2d2d2d;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPlainTextEdit#previewText {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+    }
+    QPushButton#closeButton {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 3px;
+    }
+    QPushButton#closeButton:hover {
+        background-color: #4d4d4d;
+    }
+"""
+
+# Preview section separators
+_EQ60_LINE = "=" * 60 + "\n"
+_DASH60_LINE = "-" * 60 + "\n"
+
+
+def _has_file(folder: Path, rel_path: str, listings: Dict[Path, Set[str]]) -> bool:
+    """Check for a file via one cached os.scandir listing per directory."""
+    path = folder / rel_path
+    names = listings.get(path.parent)
+    if names is None:
+        try:
+            with os.scandir(path.parent) as entries:
+                names = {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+        except OSError:
+            names = set()
+        listings[path.parent] = names
+    return os.path.normcase(path.name) in names
+
 
 class PreviewDialog(QDialog):
     """Dialog for previewing transfer changes."""
@@ -35,9 +103,10 @@ class PreviewDialog(QDialog):
         self.source_model = source_model
         self.target_model = target_model
         self.settings = settings
+        self._source_items: Optional[Tuple[List[HotkeyInfo], List[ParameterInfo]]] = None
+        self._preview_generated = False
         
         self.setup_ui()
-        self.generate_preview()
         self.apply_dark_theme()
         
         self.setWindowTitle("Transfer Preview")
@@ -45,18 +114,7 @@ class PreviewDialog(QDialog):
     
     def apply_dark_theme(self):
         """Apply dark theme to dialog."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-            }
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
     
     def setup_ui(self):
         """Setup the UI."""
@@ -64,7 +122,7 @@ class PreviewDialog(QDialog):
         
         # Header
         header = QLabel("<b>Transfer Preview</b>")
-        header.setStyleSheet("color: #ffffff; font-size: 16px; background-color: #2d2d2d; padding: 10px; border-radius: 5px;")
+        header.setObjectName("previewHeader")
         layout.addWidget(header)
         
         # Model info
@@ -72,28 +130,27 @@ class PreviewDialog(QDialog):
             f"From: <b>{self.source_model.name}</b><br>"
             f"To: <b>{self.target_model.name}</b>"
         )
-        model_info.setStyleSheet("color: #cccccc; background-color: #2d2d2d; padding: 10px; border-radius: 5px;")
+        model_info.setObjectName("modelInfo")
         layout.addWidget(model_info)
         
         # Preview text
-        self.preview_text = QTextEdit()
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
-        self.preview_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 10pt;
-            }
-        """)
+        self.preview_text.setObjectName("previewText")
+        # Set directly instead of via the stylesheet so Qt skips QSS font matching
+        preview_font = QFont()
+        preview_font.setFamilies(["Consolas", "Courier New"])
+        preview_font.setStyleHint(QFont.StyleHint.Monospace)
+        preview_font.setPointSize(10)
+        self.preview_text.setFont(preview_font)
+        self.preview_text.setPlainText("Generating preview...")
         layout.addWidget(self.preview_text, 1)
         
         # Info box
         info = QLabel(
             "ℹ This is a preview only. No changes will be made until you click 'Transfer' in the previous dialog."
         )
-        info.setStyleSheet("color: #ffaa00; background-color: #2d2d2d; padding: 10px; border-radius: 5px;")
+        info.setObjectName("previewNote")
         info.setWordWrap(True)
         layout.addWidget(info)
         
@@ -102,138 +159,167 @@ class PreviewDialog(QDialog):
         button_layout.addStretch()
         
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.clicked.connect(self.accept)
         button_layout.addWidget(close_btn)
         
         layout.addLayout(button_layout)
     
+    def showEvent(self, event):
+        """Generate the preview after the dialog has been painted once."""
+        super().showEvent(event)
+        if not self._preview_generated:
+            self._preview_generated = True
+            QTimer.singleShot(0, self.generate_preview)
+    
+    def _load_source_items(self) -> Tuple[List[HotkeyInfo], List[ParameterInfo]]:
+        """Load and parse the source model once, reusing it on later previews."""
+        if self._source_items is None:
+            source_data = VTSFileParser.load_vtube_json(self.source_model.vtube_json_path)
+            if source_data:
+                self._source_items = (
+                    VTSFileParser.parse_hotkeys(source_data),
+                    VTSFileParser.parse_parameters(source_data)
+                )
+            else:
+                self._source_items = ([], [])
+        return self._source_items
+    
     def generate_preview(self):
         """Generate preview text."""
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
+        selected_hotkey_ids = set(self.settings.selected_hotkey_ids)
+        selected_parameter_names = set(self.settings.selected_parameter_names)
         
-        lines.append("=" * 60)
-        lines.append("TRANSFER PREVIEW")
-        lines.append("=" * 60)
-        lines.append("")
+        listings: Dict[Path, Set[str]] = {}
+        
+        # The transfer only backs up (and saves) when a hotkey or parameter is
+        # actually added; hotkeys whose file the target lacks are skipped
+        will_change = False
+        if self.settings.selected_hotkey_ids or self.settings.selected_parameter_names:
+            source_hotkeys, source_params = self._load_source_items()
+            target_folder = self.target_model.folder_path
+            will_change = any(
+                param.name in selected_parameter_names for param in source_params
+            ) or any(
+                hotkey.hotkey_id in selected_hotkey_ids
+                and (not hotkey.file or _has_file(target_folder, hotkey.file, listings))
+                for hotkey in source_hotkeys
+            )
+        backup_planned = self.settings.create_backup and will_change
+        
+        write(_EQ60_LINE)
+        write("TRANSFER PREVIEW\n")
+        write(_EQ60_LINE)
+        write("\n")
         
         # Backup info
-        if self.settings.create_backup:
-            lines.append("✓ Backup will be created:")
+        if backup_planned:
+            write("✓ Backup will be created:\n")
             backup_name = f"{self.target_model.vtube_json_path.stem}.backup_[timestamp].json"
-            lines.append(f"  → backups/{backup_name}")
-            lines.append("")
+            write(f"  → backups/{backup_name}\n")
+            write("\n")
+        elif self.settings.create_backup:
+            write("ℹ No backup needed (nothing will be added)\n")
+            write("\n")
         else:
-            lines.append("⚠ No backup will be created")
-            lines.append("")
+            write("⚠ No backup will be created\n")
+            write("\n")
         
         # Hotkeys
         if self.settings.selected_hotkey_ids:
-            lines.append(f"HOTKEYS TO TRANSFER: {len(self.settings.selected_hotkey_ids)}")
-            lines.append("-" * 60)
+            write(f"HOTKEYS TO TRANSFER: {len(self.settings.selected_hotkey_ids)}\n")
+            write(_DASH60_LINE)
             
-            # Load source hotkeys
-            source_data = VTSFileParser.load_vtube_json(self.source_model.vtube_json_path)
-            if source_data:
-                source_hotkeys = VTSFileParser.parse_hotkeys(source_data)
-                
-                for hotkey in source_hotkeys:
-                    if hotkey.hotkey_id in self.settings.selected_hotkey_ids:
-                        lines.append(f"  • {hotkey.name}")
-                        lines.append(f"    Keybind: {hotkey.get_keybind_string()}")
-                        lines.append(f"    Action: {hotkey.action}")
-                        if hotkey.file:
-                            lines.append(f"    File: {hotkey.file}")
-                        
-                        if self.settings.generate_new_ids:
-                            lines.append(f"    ℹ New UUID will be generated")
-                        
-                        lines.append("")
+            # One write per hotkey record
+            uuid_note = "    ℹ New UUID will be generated\n" if self.settings.generate_new_ids else ""
+            for hotkey in source_hotkeys:
+                if hotkey.hotkey_id in selected_hotkey_ids:
+                    file_line = f"    File: {hotkey.file}\n" if hotkey.file else ""
+                    write(
+                        f"  • {hotkey.name}\n"
+                        f"    Keybind: {hotkey.get_keybind_string()}\n"
+                        f"    Action: {hotkey.action}\n"
+                        f"{file_line}{uuid_note}\n"
+                    )
             
             # Expression files
             if self.settings.copy_expression_files:
-                lines.append("EXPRESSION FILES TO COPY:")
-                lines.append("-" * 60)
+                write("EXPRESSION FILES TO COPY:\n")
+                write(_DASH60_LINE)
                 
-                files_to_copy = set()
-                for hotkey in source_hotkeys:
-                    if hotkey.hotkey_id in self.settings.selected_hotkey_ids and hotkey.file:
-                        files_to_copy.add(hotkey.file)
+                files_to_copy = {
+                    hotkey.file for hotkey in source_hotkeys
+                    if hotkey.file and hotkey.hotkey_id in selected_hotkey_ids
+                }
                 
                 if files_to_copy:
-                    for file in sorted(files_to_copy):
-                        source_file = self.source_model.folder_path / file
-                        target_file = self.target_model.folder_path / file
-                        
-                        if source_file.exists():
-                            if target_file.exists():
-                                lines.append(f"  ⚠ {file} (already exists in target - will skip)")
+                    source_folder = self.source_model.folder_path
+                    target_folder = self.target_model.folder_path
+                    for file in sorted(files_to_copy, key=str.casefold):
+                        if _has_file(source_folder, file, listings):
+                            if _has_file(target_folder, file, listings):
+                                write(f"  ⚠ {file} (already exists in target - will skip)\n")
                             else:
-                                lines.append(f"  ✓ {file}")
+                                write(f"  ✓ {file}\n")
                         else:
-                            lines.append(f"  ✗ {file} (not found in source)")
-                    lines.append("")
+                            write(f"  ✗ {file} (not found in source)\n")
+                    write("\n")
                 else:
-                    lines.append("  (none)")
-                    lines.append("")
+                    write("  (none)\n")
+                    write("\n")
         
         # Parameters
         if self.settings.selected_parameter_names:
-            lines.append(f"PARAMETERS TO TRANSFER: {len(self.settings.selected_parameter_names)}")
-            lines.append("-" * 60)
+            write(f"PARAMETERS TO TRANSFER: {len(self.settings.selected_parameter_names)}\n")
+            write(_DASH60_LINE)
             
-            # Load source parameters
-            source_data = VTSFileParser.load_vtube_json(self.source_model.vtube_json_path)
-            if source_data:
-                source_params = VTSFileParser.parse_parameters(source_data)
-                
-                for param in source_params:
-                    if param.name in self.settings.selected_parameter_names:
-                        lines.append(f"  • {param.name}")
-                        lines.append(f"    Input: {param.input_param}")
-                        lines.append(f"    Output: {param.output_param}")
-                        lines.append(f"    Range: {param.output_range[0]:.1f} to {param.output_range[1]:.1f}")
-                        lines.append(f"    Smoothing: {param.smoothing}")
-                        lines.append("")
+            # One write per parameter record
+            for param in source_params:
+                if param.name in selected_parameter_names:
+                    write(
+                        f"  • {param.name}\n"
+                        f"    Input: {param.input_param}\n"
+                        f"    Output: {param.output_param}\n"
+                        f"    Range: {param.output_range[0]:.1f} to {param.output_range[1]:.1f}\n"
+                        f"    Smoothing: {param.smoothing}\n\n"
+                    )
         
         # Summary
-        lines.append("=" * 60)
-        lines.append("SUMMARY")
-        lines.append("=" * 60)
+        write(_EQ60_LINE)
+        write("SUMMARY\n")
+        write(_EQ60_LINE)
         
         total_items = len(self.settings.selected_hotkey_ids) + len(self.settings.selected_parameter_names)
-        lines.append(f"Total items to transfer: {total_items}")
-        lines.append(f"  • Hotkeys: {len(self.settings.selected_hotkey_ids)}")
-        lines.append(f"  • Parameters: {len(self.settings.selected_parameter_names)}")
+        write(f"Total items to transfer: {total_items}\n")
+        write(f"  • Hotkeys: {len(self.settings.selected_hotkey_ids)}\n")
+        write(f"  • Parameters: {len(self.settings.selected_parameter_names)}\n")
         
         if self.settings.copy_expression_files:
-            lines.append(f"  • Expression files will be copied")
+            write(f"  • Expression files will be copied\n")
         
-        lines.append("")
+        write("\n")
         
-        if self.settings.create_backup:
-            lines.append("✓ Backup will be created before making changes")
+        if backup_planned:
+            write("✓ Backup will be created before making changes\n")
+        elif self.settings.create_backup:
+            write("ℹ Nothing will be added, so no backup will be created\n")
         else:
-            lines.append("⚠ NO BACKUP will be created")
+            write("⚠ NO BACKUP will be created\n")
         
         if self.settings.generate_new_ids:
-            lines.append("✓ New hotkey UUIDs will be generated")
+            write("✓ New hotkey UUIDs will be generated\n")
         else:
-            lines.append("⚠ Original hotkey UUIDs will be kept (may cause conflicts)")
+            write("⚠ Original hotkey UUIDs will be kept (may cause conflicts)\n")
         
-        lines.append("")
-        lines.append("=" * 60)
+        write("\n")
+        write(_EQ60_LINE.rstrip("\n"))  # No newline after the last line
         
-        # Set text
-        self.preview_text.setPlainText("\n".join(lines))
+        # Lay the text out in a fresh document, then swap it in once. The
+        # document is parented to the editor, so the previous one is deleted.
+        document = QTextDocument(self.preview_text)
+        document.setDocumentLayout(QPlainTextDocumentLayout(document))
+        document.setDefaultFont(self.preview_text.font())
+        document.setPlainText(buf.getvalue())
+        self.preview_text.setDocument(document)
@@ -11,14 +11,154 @@ from PyQt6.QtWidgets import (
     QListWidget, QListWidgetItem, QDialog, QLineEdit, QTextEdit,
     QComboBox, QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from vts_profile_manager import VTSProfileManager, ProfileInfo, ProfileCategory
 from vts_discovery import get_vts_discovery
+from styles import styled_message_box
 
 logger = logging.getLogger(__name__)
 
+# Category dropdown entries (label, category) for CreateProfileDialog
+_CATEGORY_CHOICES = (
+    ("Complete (All Settings)", ProfileCategory.COMPLETE),
+    ("Tracking Only", ProfileCategory.TRACKING),
+    ("API Settings Only", ProfileCategory.API),
+    ("UI Settings Only", ProfileCategory.UI),
+)
+_CATEGORY_LABELS = [label for label, _ in _CATEGORY_CHOICES]
+
+# Profile list entry: name on the first line, category and date below
+_PROFILE_ITEM_TEXT = "{name}\n{category} | {date}".format
+
+# ProfileManagerWidget stylesheet. Every rule names an object, so nothing
+# leaks into the dialogs and message boxes parented to the widget.
+_PANEL_QSS = """
+    QLabel#panelHeader {
+        color: #ffffff;
+        font-size: 14px;
+        background-color: transparent;
+    }
+    QListWidget#profileList {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+    }
+    QListWidget#profileList::item {
+        padding: 8px;
+        border-bottom: 1px solid #2d2d2d;
+    }
+    QListWidget#profileList::item:selected {
+        background-color: #007acc;
+    }
+    QListWidget#profileList::item:hover {
+        background-color: #2d2d2d;
+    }
+    QPushButton#refreshButton, QPushButton#secondary, QPushButton#importButton {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: none;
+        border-radius: 3px;
+    }
+    QPushButton#refreshButton:hover, QPushButton#secondary:hover, QPushButton#importButton:hover {
+        background-color: #4d4d4d;
+    }
+    QPushButton#primary {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+        border-radius: 3px;
+    }
+    QPushButton#primary:hover {
+        background-color: #0098ff;
+    }
+    QPushButton#danger {
+        background-color: #cc0000;
+        color: #ffffff;
+        border: none;
+        border-radius: 3px;
+    }
+    QPushButton#danger:hover {
+        background-color: #ff0000;
+    }
+    QPushButton#primary, QPushButton#secondary, QPushButton#danger {
+        padding: 8px 15px;
+    }
+    QPushButton#importButton {
+        padding: 6px 15px;
+    }
+    QPushButton#secondary:disabled, QPushButton#danger:disabled {
+        background-color: #2d2d2d;
+        color: #666666;
+    }
+"""
+
+
+# CreateProfileDialog stylesheet; buttons and the header are selected by object name
+_CREATE_DIALOG_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+    }
+    QWidget {
+        background-color: #1e1e1e;
+    }
+    QLabel {
+        color: #ffffff;
+        background-color: transparent;
+    }
+    QLabel#dialogHeader {
+        font-size: 14px;
+    }
+    QLineEdit {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QComboBox {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        padding: 5px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        selection-background-color: #007acc;
+    }
+    QTextEdit {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QPushButton#cancelButton {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: none;
+        padding: 8px 20px;
+        border-radius: 3px;
+    }
+    QPushButton#cancelButton:hover {
+        background-color: #4d4d4d;
+    }
+    QPushButton#createButton {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+        padding: 8px 20px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+    QPushButton#createButton:hover {
+        background-color: #0098ff;
+    }
+"""
+
 
 class CreateProfileDialog(QDialog):
     """Dialog for creating a new profile."""
@@ -41,69 +181,34 @@ class CreateProfileDialog(QDialog):
         
         # Header
         header = QLabel("<b>Create New Profile</b>")
-        header.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        header.setObjectName("dialogHeader")
         layout.addWidget(header)
         
         # Name
         name_label = QLabel("Profile Name:")
-        name_label.setStyleSheet("color: #ffffff; background-color: transparent;")
         layout.addWidget(name_label)
         
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Enter profile name...")
-        self.name_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                padding: 5px;
-                border-radius: 3px;
-            }
-        """)
         layout.addWidget(self.name_edit)
         
         # Category
         category_label = QLabel("Category:")
-        category_label.setStyleSheet("color: #ffffff; background-color: transparent;")
         layout.addWidget(category_label)
         
         self.category_combo = QComboBox()
-        self.category_combo.addItem("Complete (All Settings)", ProfileCategory.COMPLETE)
-        self.category_combo.addItem("Tracking Only", ProfileCategory.TRACKING)
-        self.category_combo.addItem("API Settings Only", ProfileCategory.API)
-        self.category_combo.addItem("UI Settings Only", ProfileCategory.UI)
-        self.category_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                padding: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                selection-background-color: #007acc;
-            }
-        """)
+        self.category_combo.addItems(_CATEGORY_LABELS)
+        for index, (_, category) in enumerate(_CATEGORY_CHOICES):
+            self.category_combo.setItemData(index, category)
         layout.addWidget(self.category_combo)
         
         # Description
         desc_label = QLabel("Description (optional):")
-        desc_label.setStyleSheet("color: #ffffff; background-color: transparent;")
         layout.addWidget(desc_label)
         
         self.desc_edit = QTextEdit()
         self.desc_edit.setPlaceholderText("Enter description...")
         self.desc_edit.setMaximumHeight(80)
-        self.desc_edit.setStyleSheet("""
-            QTextEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                padding: 5px;
-                border-radius: 3px;
-            }
-        """)
         layout.addWidget(self.desc_edit)
         
         # Buttons
@@ -111,35 +216,12 @@ class CreateProfileDialog(QDialog):
         button_layout.addStretch()
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
         create_btn = QPushButton("Create Profile")
-        create_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0098ff;
-            }
-        """)
+        create_btn.setObjectName("createButton")
         create_btn.clicked.connect(self.accept_create)
         button_layout.addWidget(create_btn)
         
@@ -147,29 +229,18 @@ class CreateProfileDialog(QDialog):
     
     def apply_dark_theme(self):
         """Apply dark theme."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-            }
-            QWidget {
-                background-color: #1e1e1e;
-            }
-        """)
+        self.setStyleSheet(_CREATE_DIALOG_QSS)
     
     def accept_create(self):
         """Accept and validate."""
         name = self.name_edit.text().strip()
         if not name:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Invalid Name")
-            msg.setText("Please enter a profile name.")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; border: none; padding: 6px 20px; }
-            """)
-            msg.exec()
+            styled_message_box(
+                self,
+                QMessageBox.Icon.Warning,
+                "Invalid Name",
+                "Please enter a profile name."
+            ).exec()
             return
         
         self.profile_name = name
@@ -183,13 +254,24 @@ class ProfileManagerWidget(QWidget):
     
     profile_loaded = pyqtSignal(str)  # Emits profile name when loaded
     
-    def __init__(self, parent=None):
+    def __init__(self, config_manager=None, parent=None):
         super().__init__(parent)
         
+        self.config = config_manager
         self.manager = VTSProfileManager()
         self.discovery = get_vts_discovery()
         self.profiles: List[ProfileInfo] = []
         
+        # Folders last used for export/import, kept in config.ini when available
+        self._last_export_dir: Optional[str] = self._stored_dir('last_export_dir')
+        self._last_import_dir: Optional[str] = self._stored_dir('last_import_dir')
+        
+        # Button states follow the selection once per 16 ms burst
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(16)
+        self._selection_timer.timeout.connect(self._apply_selection_state)
+        
         self.setup_ui()
         self.refresh_profiles()
     
@@ -202,50 +284,23 @@ class ProfileManagerWidget(QWidget):
         header_layout = QHBoxLayout()
         
         header_label = QLabel("<b>VTS Settings Profiles</b>")
-        header_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        header_label.setObjectName("panelHeader")
         header_layout.addWidget(header_label)
         
         header_layout.addStretch()
         
         self.refresh_btn = QPushButton("🔄")
+        self.refresh_btn.setObjectName("refreshButton")
         self.refresh_btn.setToolTip("Refresh profile list")
         self.refresh_btn.setFixedSize(30, 30)
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
-        self.refresh_btn.clicked.connect(self.refresh_profiles)
+        self.refresh_btn.clicked.connect(lambda: self.refresh_profiles(force=True))
         header_layout.addWidget(self.refresh_btn)
         
         layout.addLayout(header_layout)
         
         # Profile list
         self.profile_list = QListWidget()
-        self.profile_list.setStyleSheet("""
-            QListWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #2d2d2d;
-            }
-            QListWidget::item:selected {
-                background-color: #007acc;
-            }
-            QListWidget::item:hover {
-                background-color: #2d2d2d;
-            }
-        """)
+        self.profile_list.setObjectName("profileList")
         self.profile_list.itemSelectionChanged.connect(self.on_selection_changed)
         layout.addWidget(self.profile_list)
         
@@ -253,81 +308,25 @@ class ProfileManagerWidget(QWidget):
         button_layout = QHBoxLayout()
         
         self.create_btn = QPushButton("Create Profile")
-        self.create_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #0098ff;
-            }
-        """)
+        self.create_btn.setObjectName("primary")
         self.create_btn.clicked.connect(self.create_profile)
         button_layout.addWidget(self.create_btn)
         
         self.load_btn = QPushButton("Load")
+        self.load_btn.setObjectName("secondary")
         self.load_btn.setEnabled(False)
-        self.load_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-            }
-        """)
         self.load_btn.clicked.connect(self.load_profile)
         button_layout.addWidget(self.load_btn)
         
         self.export_btn = QPushButton("Export")
+        self.export_btn.setObjectName("secondary")
         self.export_btn.setEnabled(False)
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-            }
-        """)
         self.export_btn.clicked.connect(self.export_profile)
         button_layout.addWidget(self.export_btn)
         
         self.delete_btn = QPushButton("Delete")
+        self.delete_btn.setObjectName("danger")
         self.delete_btn.setEnabled(False)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #cc0000;
-                color: #ffffff;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #ff0000;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-            }
-        """)
         self.delete_btn.clicked.connect(self.delete_profile)
         button_layout.addWidget(self.delete_btn)
         
@@ -335,56 +334,73 @@ class ProfileManagerWidget(QWidget):
         
         # Import button
         import_btn = QPushButton("Import Profile...")
-        import_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 6px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        import_btn.setObjectName("importButton")
         import_btn.clicked.connect(self.import_profile)
         layout.addWidget(import_btn)
+        
+        self.setStyleSheet(_PANEL_QSS)
+    
+    def _stored_dir(self, option: str) -> Optional[str]:
+        """Get a remembered folder from the config, if any."""
+        if self.config is None:
+            return None
+        return self.config.get_string('Profiles', option) or None
+    
+    def _remember_dir(self, option: str, file_path: str) -> str:
+        """Remember the folder of a chosen file and return it."""
+        folder = str(Path(file_path).parent)
+        if self.config is not None and self.config.get_string('Profiles', option) != folder:
+            self.config.set_value('Profiles', option, folder)
+            self.config.save()
+        return folder
     
-    def refresh_profiles(self):
-        """Refresh the profile list."""
-        self.profile_list.clear()
-        self.profiles = self.manager.list_profiles()
+    def refresh_profiles(self, force: bool = False):
+        """Refresh the profile list (force=True rescans the profiles folder)."""
+        self.profiles = self.manager.list_profiles(refresh=force)
+        texts = [
+            _PROFILE_ITEM_TEXT(
+                name=profile.name,
+                category=profile.category.value,
+                date=profile.created_display
+            )
+            for profile in self.profiles
+        ]
         
-        for profile in self.profiles:
-            item = QListWidgetItem()
-            item.setText(f"{profile.name}\n{profile.category.value} | {profile.created_date.strftime('%Y-%m-%d %H:%M')}")
-            item.setData(Qt.ItemDataRole.UserRole, profile.name)
-            self.profile_list.addItem(item)
+        # Repaint once after the whole list is rebuilt
+        self.profile_list.setUpdatesEnabled(False)
+        try:
+            self.profile_list.clear()
+            for profile, text in zip(self.profiles, texts):
+                item = QListWidgetItem(text)
+                item.setData(Qt.ItemDataRole.UserRole, profile.name)
+                self.profile_list.addItem(item)
+        finally:
+            self.profile_list.setUpdatesEnabled(True)
         
         logger.info(f"Refreshed profile list: {len(self.profiles)} profiles")
     
     def on_selection_changed(self):
         """Handle selection change."""
+        self._selection_timer.start()
+    
+    def _apply_selection_state(self):
+        """Enable the selection buttons to match the current selection."""
         has_selection = len(self.profile_list.selectedItems()) > 0
-        self.load_btn.setEnabled(has_selection)
-        self.export_btn.setEnabled(has_selection)
-        self.delete_btn.setEnabled(has_selection)
+        for button in (self.load_btn, self.export_btn, self.delete_btn):
+            if button.isEnabled() != has_selection:
+                button.setEnabled(has_selection)
     
     def create_profile(self):
         """Create a new profile."""
         # Get current VTS config
         vts_config_path = self.discovery.get_vts_config_path()
         if not vts_config_path:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("VTS Not Found")
-            msg.setText("VTube Studio configuration not found.\nPlease ensure VTS is installed.")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; }
-            """)
-            msg.exec()
+            styled_message_box(
+                self,
+                QMessageBox.Icon.Warning,
+                "VTS Not Found",
+                "VTube Studio configuration not found.\nPlease ensure VTS is installed."
+            ).exec()
             return
         
         # Show create dialog
@@ -395,20 +411,16 @@ class ProfileManagerWidget(QWidget):
         # Load current VTS config
         import json
         try:
-            with open(vts_config_path, 'r', encoding='utf-8') as f:
-                vts_config = json.load(f)
+            # One read of the raw bytes; json.loads handles the decoding (and a BOM)
+            vts_config = json.loads(vts_config_path.read_bytes())
         except Exception as e:
             logger.error(f"Failed to load VTS config: {e}")
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Critical)
-            msg.setWindowTitle("Error")
-            msg.setText(f"Failed to load VTS configuration:\n{e}")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; }
-            """)
-            msg.exec()
+            styled_message_box(
+                self,
+                QMessageBox.Icon.Critical,
+                "Error",
+                f"Failed to load VTS configuration:\n{e}"
+            ).exec()
             return
         
         # Filter by category if needed
@@ -427,28 +439,21 @@ class ProfileManagerWidget(QWidget):
         )
         
         if success:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Information)
-            msg.setWindowTitle("Success")
-            msg.setText(f"Profile '{dialog.profile_name}' created successfully!")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #007acc; color: #ffffff; }
-            """)
-            msg.exec()
+            styled_message_box(
+                self,
+                QMessageBox.Icon.Information,
+                "Success",
+                f"Profile '{dialog.profile_name}' created successfully!",
+                accent=True
+            ).exec()
             self.refresh_profiles()
         else:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Critical)
-            msg.setWindowTitle("Error")
-            msg.setText("Failed to create profile. Check logs for details.")
-            msg.setStyleSheet("""
-                QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                QLabel { color: #ffffff; }
-                QPushButton { background-color: #3d3d3d; color: #ffffff; }
-            """)
-            msg.exec()
+            styled_message_box(
+                self,
+                QMessageBox.Icon.Critical,
+                "Error",
+                "Failed to create profile. Check logs for details."
+            ).exec()
     
     def load_profile(self):
         """Load selected profile."""
@@ -459,31 +464,25 @@ class ProfileManagerWidget(QWidget):
         profile_name = selected_items[0].data(Qt.ItemDataRole.UserRole)
         
         # Confirm
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Question)
-        msg.setWindowTitle("Confirm Load")
-        msg.setText(f"Load profile '{profile_name}'?\n\nThis will change your current VTS settings.\nMake sure VTS is closed before proceeding.")
-        msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        msg.setStyleSheet("""
-            QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-            QLabel { color: #ffffff; }
-            QPushButton { background-color: #3d3d3d; color: #ffffff; }
-        """)
+        msg = styled_message_box(
+            self,
+            QMessageBox.Icon.Question,
+            "Confirm Load",
+            f"Load profile '{profile_name}'?\n\nThis will change your current VTS settings.\nMake sure VTS is closed before proceeding.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         
         if msg.exec() != QMessageBox.StandardButton.Yes:
             return
         
         # TODO: Implement actual profile loading to VTS
-        info_msg = QMessageBox(self)
-        info_msg.setIcon(QMessageBox.Icon.Information)
-        info_msg.setWindowTitle("Feature In Progress")
-        info_msg.setText("Profile loading will be implemented in the next update.\n\nFor now, profiles are saved and can be exported.")
-        info_msg.setStyleSheet("""
-            QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-            QLabel { color: #ffffff; }
-            QPushButton { background-color: #007acc; color: #ffffff; }
-        """)
-        info_msg.exec()
+        styled_message_box(
+            self,
+            QMessageBox.Icon.Information,
+            "Feature In Progress",
+            "Profile loading will be implemented in the next update.\n\nFor now, profiles are saved and can be exported.",
+            accent=True
+        ).exec()
     
     def export_profile(self):
         """Export selected profile."""
@@ -497,23 +496,21 @@ class ProfileManagerWidget(QWidget):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Profile",
-            f"{profile_name}.json",
+            str(Path(self._last_export_dir or Path.home()) / f"{profile_name}.json"),
             "JSON Files (*.json)"
         )
         
         if file_path:
+            self._last_export_dir = self._remember_dir('last_export_dir', file_path)
             success = self.manager.export_profile(profile_name, Path(file_path))
             if success:
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Icon.Information)
-                msg.setWindowTitle("Success")
-                msg.setText(f"Profile exported to:\n{file_path}")
-                msg.setStyleSheet("""
-                    QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                    QLabel { color: #ffffff; }
-                    QPushButton { background-color: #007acc; color: #ffffff; }
-                """)
-                msg.exec()
+                styled_message_box(
+                    self,
+                    QMessageBox.Icon.Information,
+                    "Success",
+                    f"Profile exported to:\n{file_path}",
+                    accent=True
+                ).exec()
     
     def delete_profile(self):
         """Delete selected profile."""
@@ -524,16 +521,13 @@ class ProfileManagerWidget(QWidget):
         profile_name = selected_items[0].data(Qt.ItemDataRole.UserRole)
         
         # Confirm
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setWindowTitle("Confirm Delete")
-        msg.setText(f"Delete profile '{profile_name}'?\n\nThis action cannot be undone.")
-        msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        msg.setStyleSheet("""
-            QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-            QLabel { color: #ffffff; }
-            QPushButton { background-color: #3d3d3d; color: #ffffff; }
-        """)
+        msg = styled_message_box(
+            self,
+            QMessageBox.Icon.Warning,
+            "Confirm Delete",
+            f"Delete profile '{profile_name}'?\n\nThis action cannot be undone.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         
         if msg.exec() == QMessageBox.StandardButton.Yes:
             success = self.manager.delete_profile(profile_name)
@@ -545,21 +539,19 @@ class ProfileManagerWidget(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Import Profile",
-            str(Path.home()),
+            self._last_import_dir or str(Path.home()),
             "JSON Files (*.json)"
         )
         
         if file_path:
+            self._last_import_dir = self._remember_dir('last_import_dir', file_path)
             profile_name = self.manager.import_profile(Path(file_path))
             if profile_name:
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Icon.Information)
-                msg.setWindowTitle("Success")
-                msg.setText(f"Profile '{profile_name}' imported successfully!")
-                msg.setStyleSheet("""
-                    QMessageBox { background-color: #1e1e1e; color: #ffffff; }
-                    QLabel { color: #ffffff; }
-                    QPushButton { background-color: #007acc; color: #ffffff; }
-                """)
-                msg.exec()
+                styled_message_box(
+                    self,
+                    QMessageBox.Icon.Information,
+                    "Success",
+                    f"Profile '{profile_name}' imported successfully!",
+                    accent=True
+                ).exec()
                 self.refresh_profiles()
@@ -3,17 +3,188 @@ Result Dialog - Shows detailed transfer results
 """
 
 import logging
+from typing import List, Optional, Tuple
+
+from PyQt6 import sip
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QGroupBox
+    QWidget, QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, QLabel,
+    QPushButton, QPlainTextEdit, QGroupBox, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
 from model_settings_manager import TransferResult
+from styles import styled_message_box
 
 logger = logging.getLogger(__name__)
 
+# Rules shared by both result dialogs, selected by object name
+_SHARED_QSS = """
+    QLabel#headerSuccess, QLabel#headerFailure {
+        font-size: 16px;
+        background-color: #2d2d2d;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QLabel#headerSuccess {
+        color: #00ff00;
+    }
+    QLabel#headerFailure {
+        color: #ff0000;
+    }
+    QPlainTextEdit#logView {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 9pt;
+    }
+    QPushButton#closeButton {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 3px;
+    }
+    QPushButton#closeButton:hover {
+        background-color: #0098ff;
+    }
+"""
+
+# RestoreResultDialog stylesheet, applied once on the dialog
+_RESTORE_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+    }
+    QWidget {
+        background-color: #1e1e1e;
+    }
+    QFrame#summaryBox {
+        background-color: #2d2d2d;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QLabel#summaryText {
+        color: #cccccc;
+        background-color: transparent;
+    }
+    QLabel#logLabel {
+        color: #ffffff;
+        background-color: transparent;
+    }
+""" + _SHARED_QSS
+
+# ResultDialog stylesheet, applied once on the dialog
+_RESULT_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+    }
+    QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QGroupBox {
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #2d2d2d;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QGroupBox#warnings {
+        color: #ffaa00;
+    }
+    QGroupBox#errors {
+        color: #ff0000;
+    }
+    QLabel#summaryText {
+        color: #cccccc;
+        background-color: transparent;
+    }
+    QPlainTextEdit#warningsText, QPlainTextEdit#errorsText {
+        background-color: #1e1e1e;
+        border: 1px solid #3d3d3d;
+        font-family: 'Consolas', 'Courier New', monospace;
+    }
+    QPlainTextEdit#warningsText {
+        color: #ffaa00;
+    }
+    QPlainTextEdit#errorsText {
+        color: #ff0000;
+    }
+    QPushButton#undoButton {
+        background-color: #ffaa00;
+        color: #000000;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+    QPushButton#undoButton:hover {
+        background-color: #ffcc00;
+    }
+""" + _SHARED_QSS
+
+# Detailed log lines appended per event-loop pass once a dialog is shown
+LOG_CHUNK_LINES = 500
+
+
+def _append_log_chunk(view: QPlainTextEdit, lines: List[str], start: int) -> int:
+    """Append the next chunk of log lines to view and return the new position."""
+    end = start + LOG_CHUNK_LINES
+    scroll_bar = view.verticalScrollBar()
+    scroll_pos = scroll_bar.value()  # appendPlainText would follow the end
+    view.setUpdatesEnabled(False)
+    try:
+        view.appendPlainText("\n".join(lines[start:end]))
+        scroll_bar.setValue(scroll_pos)
+    finally:
+        view.setUpdatesEnabled(True)
+    return end
+
+
+# Line prefixes for the warnings and errors panes
+_WARNING_PREFIX = "⚠ "
+_ERROR_PREFIX = "✗ "
+
+
+def _fill_issue_text(view: QPlainTextEdit, prefix: str, items: List[str]):
+    """Replace view's text with one prefixed line per item."""
+    view.setUpdatesEnabled(False)
+    try:
+        view.clear()
+        append = view.appendPlainText
+        for item in items:
+            append(prefix + item)
+        view.verticalScrollBar().setValue(0)  # appendPlainText follows the end
+    finally:
+        view.setUpdatesEnabled(True)
+
+
+def _add_summary_row(grid: QGridLayout, row: int, key: str) -> Tuple[QLabel, QLabel]:
+    """Add a bold "key:" label and an empty value label to a summary grid."""
+    key_label = QLabel(f"{key}:")
+    key_label.setObjectName("summaryText")
+    key_label.setTextFormat(Qt.TextFormat.PlainText)
+    font = key_label.font()
+    font.setBold(True)
+    key_label.setFont(font)
+    grid.addWidget(key_label, row, 0)
+    
+    value_label = QLabel()
+    value_label.setObjectName("summaryText")
+    value_label.setTextFormat(Qt.TextFormat.PlainText)
+    grid.addWidget(value_label, row, 1)
+    return key_label, value_label
+
 
 class RestoreResultDialog(QDialog):
     """Dialog for displaying restore results."""
@@ -22,6 +193,8 @@ class RestoreResultDialog(QDialog):
         super().__init__(parent)
         
         self.report = report
+        self._log_pos = 0
+        self._log_started = False
         
         self.setup_ui()
         self.apply_dark_theme()
@@ -35,332 +208,256 @@ class RestoreResultDialog(QDialog):
         # Status header
         if self.report.success:
             status_text = "✓ Restore Completed"
-            status_color = "#00ff00"
+            header_name = "headerSuccess"
         else:
             status_text = "✗ Restore Failed"
-            status_color = "#ff0000"
+            header_name = "headerFailure"
         
         header = QLabel(f"<b>{status_text}</b>")
-        header.setStyleSheet(f"color: {status_color}; font-size: 16px; background-color: #2d2d2d; padding: 10px; border-radius: 5px;")
+        header.setObjectName(header_name)
         layout.addWidget(header)
         
         # Summary
-        summary_text = f"""
-<b>Files Restored:</b> {self.report.files_restored}<br>
-<b>Files Skipped:</b> {self.report.files_skipped}
-        """.strip()
+        summary_box = QFrame()
+        summary_box.setObjectName("summaryBox")
+        summary_layout = QGridLayout(summary_box)
+        summary_layout.setContentsMargins(0, 0, 0, 0)
+        summary_layout.setColumnStretch(1, 1)
         
+        _add_summary_row(summary_layout, 0, "Files Restored")[1].setText(str(self.report.files_restored))
+        _add_summary_row(summary_layout, 1, "Files Skipped")[1].setText(str(self.report.files_skipped))
         if self.report.pre_restore_backup_path:
-            summary_text += f"<br><b>Pre-restore Backup:</b> {self.report.pre_restore_backup_path.name}"
+            _add_summary_row(summary_layout, 2, "Pre-restore Backup")[1].setText(
+                self.report.pre_restore_backup_path.name
+            )
         
-        summary_label = QLabel(summary_text)
-        summary_label.setStyleSheet("color: #cccccc; background-color: #2d2d2d; padding: 10px; border-radius: 5px;")
-        layout.addWidget(summary_label)
+        layout.addWidget(summary_box)
         
         # Log
         log_label = QLabel("<b>Detailed Log:</b>")
-        log_label.setStyleSheet("color: #ffffff; background-color: transparent;")
+        log_label.setObjectName("logLabel")
         layout.addWidget(log_label)
         
-        log_text = QTextEdit()
-        log_text.setReadOnly(True)
-        log_text.setPlainText("\n".join(self.report.detailed_log))
-        log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 9pt;
-            }
-        """)
-        layout.addWidget(log_text, 1)
+        # Filled in chunks once the dialog is shown (see _pump_log)
+        self.log_text = QPlainTextEdit()
+        self.log_text.setObjectName("logView")
+        self.log_text.setReadOnly(True)
+        self.log_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        layout.addWidget(self.log_text, 1)
         
         # Close button
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #0098ff;
-            }
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
     
     def apply_dark_theme(self):
         """Apply dark theme."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-            }
-            QWidget {
-                background-color: #1e1e1e;
-            }
-        """)
+        self.setStyleSheet(_RESTORE_QSS)
+    
+    def showEvent(self, event):
+        """Start filling the detailed log after the dialog has been painted once."""
+        super().showEvent(event)
+        if not self._log_started:
+            self._log_started = True
+            QTimer.singleShot(0, self._pump_log)
+    
+    def _pump_log(self):
+        """Append the next chunk of the detailed log, rescheduling until done."""
+        lines = self.report.detailed_log
+        if self._log_pos < len(lines):
+            self._log_pos = _append_log_chunk(self.log_text, lines, self._log_pos)
+            if self._log_pos < len(lines):
+                QTimer.singleShot(0, self._pump_log)
 
 
 class ResultDialog(QDialog):
     """Dialog for displaying transfer results."""
     
+    _instance: Optional['ResultDialog'] = None  # Reused by show_for()
+    
     def __init__(self, result: TransferResult, parent=None):
         super().__init__(parent)
         
-        self.result = result
-        
         self.setup_ui()
         self.apply_dark_theme()
         self.setWindowTitle("Transfer Results")
         self.resize(700, 500)
+        self._rebind(result)
+    
+    @classmethod
+    def show_for(cls, result: TransferResult, parent=None) -> int:
+        """Show result in the shared dialog, building it on first use."""
+        dialog = cls._instance
+        if dialog is None or sip.isdeleted(dialog):
+            dialog = cls._instance = cls(result, parent)
+        else:
+            if dialog.parent() is not parent:
+                dialog.setParent(parent, dialog.windowFlags())
+            dialog._rebind(result)
+        return dialog.exec()
     
     def apply_dark_theme(self):
         """Apply dark theme to dialog."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-            }
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_RESULT_QSS)
+    
+    def showEvent(self, event):
+        """Start filling the detailed log after the dialog has been painted once."""
+        super().showEvent(event)
+        if not self._log_started:
+            self._log_started = True
+            QTimer.singleShot(0, self._pump_log)
+    
+    def _pump_log(self):
+        """Append the next chunk of the detailed log, rescheduling until done."""
+        lines = self.result.detailed_log
+        if self._log_pos < len(lines):
+            self._log_pos = _append_log_chunk(self.log_text, lines, self._log_pos)
+            if self._log_pos < len(lines):
+                QTimer.singleShot(0, self._pump_log)
     
     def setup_ui(self):
-        """Setup the UI."""
+        """Setup the UI. Result data is filled in by _rebind()."""
         layout = QVBoxLayout(self)
         
         # Status header
-        if self.result.success:
-            status_text = "✓ Transfer Completed Successfully"
-            status_color = "#00ff00"
-        else:
-            status_text = "✗ Transfer Failed"
-            status_color = "#ff0000"
-        
-        header = QLabel(f"<b>{status_text}</b>")
-        header.setStyleSheet(f"color: {status_color}; font-size: 16px; background-color: #2d2d2d; padding: 10px; border-radius: 5px;")
-        layout.addWidget(header)
+        self.header = QLabel()
+        layout.addWidget(self.header)
         
         # Summary
         summary_group = QGroupBox("Summary")
-        summary_group.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #2d2d2d;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        summary_layout = QVBoxLayout(summary_group)
-        
-        summary_text = f"""
-<b>Changes:</b> {self.result.changes_summary}<br>
-<b>Hotkeys Added:</b> {self.result.hotkeys_added}<br>
-<b>Parameters Added:</b> {self.result.parameters_added}<br>
-<b>Files Copied:</b> {self.result.files_copied}
-        """.strip()
-        
-        if self.result.backup_path:
-            summary_text += f"<br><b>Backup:</b> {self.result.backup_path.name}"
-        
-        summary_label = QLabel(summary_text)
-        summary_label.setStyleSheet("color: #cccccc; background-color: transparent;")
-        summary_layout.addWidget(summary_label)
+        summary_layout = QGridLayout(summary_group)
+        summary_layout.setColumnStretch(1, 1)
+        
+        self.changes_value = _add_summary_row(summary_layout, 0, "Changes")[1]
+        self.hotkeys_value = _add_summary_row(summary_layout, 1, "Hotkeys Added")[1]
+        self.parameters_value = _add_summary_row(summary_layout, 2, "Parameters Added")[1]
+        self.files_value = _add_summary_row(summary_layout, 3, "Files Copied")[1]
+        self.backup_key, self.backup_value = _add_summary_row(summary_layout, 4, "Backup")
         
         layout.addWidget(summary_group)
         
-        # Warnings
-        if self.result.warnings:
-            warnings_group = QGroupBox(f"Warnings ({len(self.result.warnings)})")
-            warnings_group.setStyleSheet("""
-                QGroupBox {
-                    color: #ffaa00;
-                    border: 1px solid #3d3d3d;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    background-color: #2d2d2d;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-            """)
-            warnings_layout = QVBoxLayout(warnings_group)
-            
-            warnings_text = QTextEdit()
-            warnings_text.setReadOnly(True)
-            warnings_text.setMaximumHeight(100)
-            warnings_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #1e1e1e;
-                    color: #ffaa00;
-                    border: 1px solid #3d3d3d;
-                    font-family: 'Consolas', 'Courier New', monospace;
-                }
-            """)
-            warnings_text.setPlainText("\n".join(f"⚠ {w}" for w in self.result.warnings))
-            warnings_layout.addWidget(warnings_text)
-            
-            layout.addWidget(warnings_group)
+        # Warnings and errors, built by _rebind() the first time they are needed
+        self.warnings_group: Optional[QGroupBox] = None
+        self.warnings_text: Optional[QPlainTextEdit] = None
+        self.errors_group: Optional[QGroupBox] = None
+        self.errors_text: Optional[QPlainTextEdit] = None
         
-        # Errors
-        if self.result.errors:
-            errors_group = QGroupBox(f"Errors ({len(self.result.errors)})")
-            errors_group.setStyleSheet("""
-                QGroupBox {
-                    color: #ff0000;
-                    border: 1px solid #3d3d3d;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    background-color: #2d2d2d;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-            """)
-            errors_layout = QVBoxLayout(errors_group)
-            
-            errors_text = QTextEdit()
-            errors_text.setReadOnly(True)
-            errors_text.setMaximumHeight(100)
-            errors_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #1e1e1e;
-                    color: #ff0000;
-                    border: 1px solid #3d3d3d;
-                    font-family: 'Consolas', 'Courier New', monospace;
-                }
-            """)
-            errors_text.setPlainText("\n".join(f"✗ {e}" for e in self.result.errors))
-            errors_layout.addWidget(errors_text)
-            
-            layout.addWidget(errors_group)
-        
-        # Detailed log
-        log_group = QGroupBox("Detailed Log")
-        log_group.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #2d2d2d;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        log_layout = QVBoxLayout(log_group)
-        
-        self.log_text = QTextEdit()
+        # Detailed log, filled in chunks once the dialog is shown (see _pump_log)
+        self.log_group = QGroupBox("Detailed Log")
+        log_layout = QVBoxLayout(self.log_group)
+        
+        self.log_text = QPlainTextEdit()
+        self.log_text.setObjectName("logView")
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 9pt;
-            }
-        """)
-        self.log_text.setPlainText("\n".join(self.result.detailed_log))
+        self.log_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         log_layout.addWidget(self.log_text)
         
-        layout.addWidget(log_group, 1)
+        layout.addWidget(self.log_group, 1)
         
         # Buttons
         button_layout = QHBoxLayout()
         
-        if self.result.success and self.result.can_undo and self.result.undo_backup_path:
-            undo_btn = QPushButton("Undo Transfer (Restore Backup)")
-            undo_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffaa00;
-                    color: #000000;
-                    border: none;
-                    padding: 10px 20px;
-                    border-radius: 3px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #ffcc00;
-                }
-            """)
-            undo_btn.clicked.connect(self.undo_transfer)
-            button_layout.addWidget(undo_btn)
+        self.undo_btn = QPushButton("Undo Transfer (Restore Backup)")
+        self.undo_btn.setObjectName("undoButton")
+        self.undo_btn.clicked.connect(self.undo_transfer)
+        button_layout.addWidget(self.undo_btn)
         
         button_layout.addStretch()
         
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #0098ff;
-            }
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.clicked.connect(self.accept)
         button_layout.addWidget(close_btn)
         
         layout.addLayout(button_layout)
     
+    def _build_issue_group(
+        self,
+        object_name: str,
+        before: QWidget
+    ) -> Tuple[QGroupBox, QPlainTextEdit]:
+        """Build a warnings/errors group and insert it above before."""
+        group = QGroupBox()
+        group.setObjectName(object_name)
+        group_layout = QVBoxLayout(group)
+        
+        text = QPlainTextEdit()
+        text.setObjectName(f"{object_name}Text")
+        text.setReadOnly(True)
+        text.setMaximumHeight(100)
+        group_layout.addWidget(text)
+        
+        layout = self.layout()
+        layout.insertWidget(layout.indexOf(before), group)
+        return group, text
+    
+    def _rebind(self, result: TransferResult):
+        """Show a new result in the existing widgets."""
+        self.result = result
+        
+        # Status header; the object name selects the colour, so re-polish it
+        if result.success:
+            self.header.setText("<b>✓ Transfer Completed Successfully</b>")
+            self.header.setObjectName("headerSuccess")
+        else:
+            self.header.setText("<b>✗ Transfer Failed</b>")
+            self.header.setObjectName("headerFailure")
+        self.header.style().unpolish(self.header)
+        self.header.style().polish(self.header)
+        
+        # Summary
+        self.changes_value.setText(result.changes_summary)
+        self.hotkeys_value.setText(str(result.hotkeys_added))
+        self.parameters_value.setText(str(result.parameters_added))
+        self.files_value.setText(str(result.files_copied))
+        
+        if result.backup_path:
+            self.backup_value.setText(result.backup_path.name)
+        self.backup_key.setVisible(bool(result.backup_path))
+        self.backup_value.setVisible(bool(result.backup_path))
+        
+        # Warnings and errors sit between the summary and the log
+        if result.warnings:
+            if self.warnings_group is None:
+                self.warnings_group, self.warnings_text = self._build_issue_group(
+                    "warnings",
+                    self.errors_group if self.errors_group is not None else self.log_group
+                )
+            self.warnings_group.setTitle(f"Warnings ({len(result.warnings)})")
+            _fill_issue_text(self.warnings_text, _WARNING_PREFIX, result.warnings)
+        if self.warnings_group is not None:
+            self.warnings_group.setVisible(bool(result.warnings))
+        
+        # Errors
+        if result.errors:
+            if self.errors_group is None:
+                self.errors_group, self.errors_text = self._build_issue_group(
+                    "errors", self.log_group
+                )
+            self.errors_group.setTitle(f"Errors ({len(result.errors)})")
+            _fill_issue_text(self.errors_text, _ERROR_PREFIX, result.errors)
+        if self.errors_group is not None:
+            self.errors_group.setVisible(bool(result.errors))
+        
+        # Detailed log is refilled on the next show
+        self.log_text.clear()
+        self._log_pos = 0
+        self._log_started = False
+        
+        self.undo_btn.setVisible(
+            bool(result.success and result.can_undo and result.undo_backup_path)
+        )
+    
     def undo_transfer(self):
         """Undo the transfer by restoring the backup."""
-        from PyQt6.QtWidgets import QMessageBox
-        from model_settings_manager import ModelSettingsManager
-        
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Question)
-        msg.setWindowTitle("Confirm Undo")
-        msg.setText("This will restore the target model to its state before the transfer.\n\nContinue?")
-        msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                padding: 6px 20px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        msg = styled_message_box(
+            self,
+            QMessageBox.Icon.Question,
+            "Confirm Undo",
+            "This will restore the target model to its state before the transfer.\n\nContinue?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         reply = msg.exec()
         
         if reply == QMessageBox.StandardButton.Yes:
@@ -368,33 +465,13 @@ class ResultDialog(QDialog):
             # backup path is like: backups/ModelName.backup_timestamp.json
             # need to restore to the original .vtube.json location
             
-            info_msg = QMessageBox(self)
-            info_msg.setIcon(QMessageBox.Icon.Information)
-            info_msg.setWindowTitle("Undo")
-            info_msg.setText(
+            styled_message_box(
+                self,
+                QMessageBox.Icon.Information,
+                "Undo",
                 "To manually undo:\n\n"
                 f"1. Find the backup file: {self.result.undo_backup_path.name}\n"
                 f"2. Copy it to the model folder\n"
                 f"3. Rename it to replace the .vtube.json file\n\n"
                 "Automatic undo will be implemented in a future update."
-            )
-            info_msg.setStyleSheet("""
-                QMessageBox {
-                    background-color: #1e1e1e;
-                    color: #ffffff;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #3d3d3d;
-                    color: #ffffff;
-                    border: none;
-                    padding: 6px 20px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #4d4d4d;
-                }
-            """)
-            info_msg.exec()
+            ).exec()
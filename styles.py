@@ -0,0 +1,110 @@
+"""
+Styles - Application-wide stylesheet for VTS Control Panel
+
+Rules here are parsed once by QApplication.setStyleSheet. Only rules that are
+scoped by widget class, object name or "role" property belong here; broad type
+selectors (plain QCheckBox, QPushButton, ...) stay on the widget that owns them
+so they don't leak into other tabs or AIKA's parameter components.
+
+The message box sheet below is the exception: it is set on each box by
+styled_message_box(), shared by the dialogs that need a dark QMessageBox.
+"""
+
+from PyQt6.QtWidgets import QWidget, QMessageBox
+
+# Main window and tab bar
+MAIN_WINDOW_QSS = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    QTabWidget::pane {
+        border: 1px solid #3d3d3d;
+        background-color: #252525;
+    }
+    QTabBar::tab {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        padding: 8px 20px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #007acc;
+    }
+    QTabBar::tab:hover {
+        background-color: #3d3d3d;
+    }
+"""
+
+# Backup tab; labels and separators opt in via their "role" property
+BACKUP_TAB_QSS = """
+    QScrollArea#backupScroll {
+        border: none;
+        background-color: #1e1e1e;
+    }
+    QWidget#backupContent {
+        background-color: #1e1e1e;
+    }
+    
+    BackupTab QLabel[role="heading"] { color: #ffffff; background-color: transparent; }
+    BackupTab QLabel[role="category"] { color: #ffffff; background-color: transparent; margin-top: 10px; }
+    BackupTab QLabel[role="firstAppHeading"] { color: #888888; background-color: transparent; margin-top: 5px; }
+    BackupTab QLabel[role="appHeading"] { color: #888888; background-color: transparent; margin-top: 10px; }
+    BackupTab QLabel[role="intro"] { color: #cccccc; background-color: transparent; font-size: 11pt; }
+    BackupTab QLabel[role="description"] { color: #cccccc; background-color: transparent; }
+    
+    BackupTab QFrame[role="separator"] { color: #3d3d3d; }
+    BackupTab QFrame[role="sectionSeparator"] { color: #3d3d3d; margin-top: 15px; }
+    
+    BackupTab QLabel[role="placeholder"] {
+        color: #666666;
+        background-color: #252525;
+        padding: 15px;
+        border: 2px dashed #3d3d3d;
+        border-radius: 5px;
+    }
+"""
+
+GLOBAL_QSS = MAIN_WINDOW_QSS + BACKUP_TAB_QSS
+
+# Dark message boxes: neutral buttons for warnings/errors/questions, accent for success
+_MESSAGE_BOX_QSS = """
+    QMessageBox {{
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }}
+    QLabel {{
+        color: #ffffff;
+    }}
+    QPushButton {{
+        background-color: {button};
+        color: #ffffff;
+        border: none;
+        padding: 6px 20px;
+        border-radius: 3px;
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+"""
+_MESSAGE_BOX_SHEETS = {
+    False: _MESSAGE_BOX_QSS.format(button="#3d3d3d", hover="#4d4d4d"),
+    True: _MESSAGE_BOX_QSS.format(button="#007acc", hover="#0098ff"),
+}
+
+
+def styled_message_box(
+    parent: QWidget,
+    icon: QMessageBox.Icon,
+    title: str,
+    text: str,
+    buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Ok,
+    accent: bool = False
+) -> QMessageBox:
+    """Build a dark-themed message box (accent=True for blue buttons)."""
+    msg = QMessageBox(parent)
+    msg.setIcon(icon)
+    msg.setWindowTitle(title)
+    msg.setText(text)
+    msg.setStandardButtons(buttons)
+    msg.setStyleSheet(_MESSAGE_BOX_SHEETS[accent])
+    return msg
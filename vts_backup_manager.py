@@ -4,17 +4,36 @@ VTS Backup Manager - Complete configuration backup and restore
 
 import json
 import logging
+import os
 import zipfile
 import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for streaming ZIP members to disk
+COPY_CHUNK_SIZE = 1024 * 1024
 
-@dataclass
+# Maximum number of idle copy buffers kept per manager
+MAX_POOLED_BUFFERS = 4
+
+# Backup read-ahead: worker threads loading files while the ZIP writer compresses
+BACKUP_READ_WORKERS = 4
+BACKUP_READ_AHEAD = 64
+
+# Deflate level for backup entries (configs are small JSON; level 3 is near-max ratio for them)
+BACKUP_COMPRESS_LEVEL = 3
+
+# File types that are already compressed and are stored as-is
+INCOMPRESSIBLE_SUFFIXES = frozenset({'.png', '.jpg', '.jpeg', '.webp', '.mp4', '.ogg'})
+
+
+@dataclass(frozen=True, slots=True)
 class BackupOptions:
     """Options for creating a backup."""
     include_global_config: bool = True
@@ -70,6 +89,9 @@ class VTSBackupManager:
         
         self.backup_dir = backup_dir
         self.backup_dir.mkdir(exist_ok=True)
+        
+        # Reusable copy buffers (deque append/pop are thread-safe)
+        self._buffer_pool = deque()
         logger.info(f"VTSBackupManager initialized (backup dir: {self.backup_dir})")
     
     def create_backup(
@@ -105,96 +127,25 @@ class VTSBackupManager:
             # Create backup manifest
             manifest = self._create_manifest(vts_root, options)
             
+            # Enumerate everything up front, then stream it into the ZIP in one pass
+            files = self._collect_backup_files(streaming_assets, options)
+            
             # Create ZIP file
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=BACKUP_COMPRESS_LEVEL) as zipf:
                 # Add manifest
                 zipf.writestr("backup_manifest.json", json.dumps(manifest, indent=2))
                 
-                # Add global config
-                if options.include_global_config:
-                    config_file = streaming_assets / "Config" / "vts_config.json"
-                    if config_file.exists():
-                        zipf.write(config_file, "Config/vts_config.json")
-                        logger.info("  ✓ Added vts_config.json")
-                
-                # Add custom parameters
-                if options.include_custom_parameters:
-                    params_file = streaming_assets / "Config" / "custom_parameters.json"
-                    if params_file.exists():
-                        zipf.write(params_file, "Config/custom_parameters.json")
-                        logger.info("  ✓ Added custom_parameters.json")
-                
-                # Add calibration files
-                if options.include_calibration:
-                    calibration_files = [
-                        "Config/vts_lipsync_ulipsync.json",
-                        "Config/webcam_calibration_mediapipe.json"
-                    ]
-                    for rel_path in calibration_files:
-                        full_path = streaming_assets / rel_path
-                        if full_path.exists():
-                            zipf.write(full_path, rel_path)
-                            logger.info(f"  ✓ Added {rel_path}")
-                
-                # Add visual effects
-                if options.include_visual_effects:
-                    effects_file = streaming_assets / "Effects" / "vts_saved_visual_effects.effects.json"
-                    if effects_file.exists():
-                        zipf.write(effects_file, "Effects/vts_saved_visual_effects.effects.json")
-                        logger.info("  ✓ Added visual effects")
-                
-                # Add model configs
-                if options.include_model_configs:
-                    models_path = streaming_assets / "Live2DModels"
-                    if models_path.exists():
-                        count = 0
-                        for model_folder in models_path.iterdir():
-                            if not model_folder.is_dir():
-                                continue
-                            
-                            # Find .vtube.json files
-                            for vtube_file in model_folder.glob("*.vtube.json"):
-                                # Skip backup files
-                                if '.original' in vtube_file.name or '.backup' in vtube_file.name:
-                                    continue
-                                
-                                rel_path = vtube_file.relative_to(streaming_assets)
-                                zipf.write(vtube_file, str(rel_path))
-                                count += 1
-                        
-                        logger.info(f"  ✓ Added {count} model configs")
-                
-                # Add item configs
-                if options.include_item_configs:
-                    items_path = streaming_assets / "Items"
-                    if items_path.exists():
-                        count = 0
-                        for item_folder in items_path.iterdir():
-                            if not item_folder.is_dir():
-                                continue
-                            
-                            # Find .vtube.json files
-                            for vtube_file in item_folder.glob("*.vtube.json"):
-                                # Skip backup files
-                                if '.original' in vtube_file.name or '.backup' in vtube_file.name:
-                                    continue
-                                
-                                rel_path = vtube_file.relative_to(streaming_assets)
-                                zipf.write(vtube_file, str(rel_path))
-                                count += 1
-                        
-                        logger.info(f"  ✓ Added {count} item configs")
-                
-                # Add plugin auth (if requested)
-                if options.include_plugin_auth:
-                    plugins_path = streaming_assets / "Config" / "Plugins"
-                    if plugins_path.exists():
-                        count = 0
-                        for auth_file in plugins_path.glob("*.vtsauth"):
-                            rel_path = auth_file.relative_to(streaming_assets)
-                            zipf.write(auth_file, str(rel_path))
-                            count += 1
-                        logger.info(f"  ✓ Added {count} plugin auth files")
+                # Files are read on worker threads; the ZIP is written in order on this one
+                with ThreadPoolExecutor(max_workers=BACKUP_READ_WORKERS) as pool:
+                    pending = deque()
+                    for source_path, arcname in files:
+                        pending.append(pool.submit(self._read_zip_entry, source_path, arcname))
+                        if len(pending) >= BACKUP_READ_AHEAD:
+                            zinfo, data = pending.popleft().result()
+                            zipf.writestr(zinfo, data, compresslevel=BACKUP_COMPRESS_LEVEL)
+                    while pending:
+                        zinfo, data = pending.popleft().result()
+                        zipf.writestr(zinfo, data, compresslevel=BACKUP_COMPRESS_LEVEL)
             
             file_size = output_path.stat().st_size / (1024 * 1024)  # MB
             logger.info(f"✓ Backup created: {output_path.name} ({file_size:.2f} MB)")
@@ -224,6 +175,7 @@ class VTSBackupManager:
             RestoreReport with operation details
         """
         report = RestoreReport(success=False)
+        buffer = self._acquire_buffer()
         
         try:
             if not backup_path.exists():
@@ -290,8 +242,8 @@ class VTSBackupManager:
                         target_path = streaming_assets / filename
                         target_path.parent.mkdir(parents=True, exist_ok=True)
                         
-                        with zipf.open(filename) as source, open(target_path, 'wb') as target:
-                            target.write(source.read())
+                        with zipf.open(file_info) as source, open(target_path, 'wb') as target:
+                            self._copy_stream(source, target, buffer)
                         
                         report.files_restored += 1
                         report.detailed_log.append(f"✓ Restored: {filename}")
@@ -308,6 +260,8 @@ class VTSBackupManager:
             logger.error(f"Restore failed: {e}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
+        finally:
+            self._release_buffer(buffer)
         
         return report
     
@@ -378,6 +332,146 @@ class VTSBackupManager:
             logger.error(f"Failed to list backup contents: {e}")
             return None
     
+    def _collect_backup_files(self, streaming_assets: Path, options: BackupOptions) -> List[Tuple[Path, str]]:
+        """
+        Enumerate the files to include in a backup.
+        
+        Args:
+            streaming_assets: VTS StreamingAssets folder
+            options: Backup options
+            
+        Returns:
+            List of (source_path, archive_name) tuples
+        """
+        files: List[Tuple[Path, str]] = []
+        
+        # Global config
+        if options.include_global_config:
+            config_file = streaming_assets / "Config" / "vts_config.json"
+            if config_file.exists():
+                files.append((config_file, "Config/vts_config.json"))
+                logger.info("  ✓ Added vts_config.json")
+        
+        # Custom parameters
+        if options.include_custom_parameters:
+            params_file = streaming_assets / "Config" / "custom_parameters.json"
+            if params_file.exists():
+                files.append((params_file, "Config/custom_parameters.json"))
+                logger.info("  ✓ Added custom_parameters.json")
+        
+        # Calibration files
+        if options.include_calibration:
+            calibration_files = [
+                "Config/vts_lipsync_ulipsync.json",
+                "Config/webcam_calibration_mediapipe.json"
+            ]
+            for rel_path in calibration_files:
+                full_path = streaming_assets / rel_path
+                if full_path.exists():
+                    files.append((full_path, rel_path))
+                    logger.info(f"  ✓ Added {rel_path}")
+        
+        # Visual effects
+        if options.include_visual_effects:
+            effects_file = streaming_assets / "Effects" / "vts_saved_visual_effects.effects.json"
+            if effects_file.exists():
+                files.append((effects_file, "Effects/vts_saved_visual_effects.effects.json"))
+                logger.info("  ✓ Added visual effects")
+        
+        # Model configs
+        if options.include_model_configs:
+            models_path = streaming_assets / "Live2DModels"
+            if models_path.exists():
+                model_files = self._scan_vtube_files(models_path, "Live2DModels")
+                files.extend(model_files)
+                logger.info(f"  ✓ Added {len(model_files)} model configs")
+        
+        # Item configs
+        if options.include_item_configs:
+            items_path = streaming_assets / "Items"
+            if items_path.exists():
+                item_files = self._scan_vtube_files(items_path, "Items")
+                files.extend(item_files)
+                logger.info(f"  ✓ Added {len(item_files)} item configs")
+        
+        # Plugin auth (if requested)
+        if options.include_plugin_auth:
+            plugins_path = streaming_assets / "Config" / "Plugins"
+            if plugins_path.exists():
+                count = 0
+                for auth_file in plugins_path.glob("*.vtsauth"):
+                    rel_path = auth_file.relative_to(streaming_assets)
+                    files.append((auth_file, str(rel_path)))
+                    count += 1
+                logger.info(f"  ✓ Added {count} plugin auth files")
+        
+        return files
+    
+    def _scan_vtube_files(self, root: Path, arc_prefix: str) -> List[Tuple[Path, str]]:
+        """
+        Find the .vtube.json files one level below root.
+        
+        Uses os.scandir so the directory checks come from the cached
+        directory entries instead of a separate stat per path.
+        
+        Args:
+            root: Live2DModels or Items folder
+            arc_prefix: Archive folder name for root
+            
+        Returns:
+            List of (source_path, archive_name) tuples
+        """
+        files: List[Tuple[Path, str]] = []
+        with os.scandir(root) as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+                
+                with os.scandir(folder.path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.endswith(".vtube.json"):
+                            continue
+                        
+                        # Skip backup files
+                        if '.original' in name or '.backup' in name:
+                            continue
+                        
+                        files.append((Path(entry.path), f"{arc_prefix}/{folder.name}/{name}"))
+        return files
+    
+    @staticmethod
+    def _read_zip_entry(source_path: Path, arcname: str) -> Tuple[zipfile.ZipInfo, bytes]:
+        """Read a file for the backup, keeping its timestamp in the ZIP entry."""
+        zinfo = zipfile.ZipInfo.from_file(source_path, arcname)
+        if source_path.suffix.lower() in INCOMPRESSIBLE_SUFFIXES:
+            zinfo.compress_type = zipfile.ZIP_STORED
+        else:
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+        return zinfo, source_path.read_bytes()
+    
+    def _acquire_buffer(self) -> bytearray:
+        """Take a copy buffer from the pool, allocating one if the pool is empty."""
+        try:
+            return self._buffer_pool.pop()
+        except IndexError:
+            return bytearray(COPY_CHUNK_SIZE)
+    
+    def _release_buffer(self, buffer: bytearray):
+        """Return a copy buffer to the pool."""
+        if len(self._buffer_pool) < MAX_POOLED_BUFFERS:
+            self._buffer_pool.append(buffer)
+    
+    @staticmethod
+    def _copy_stream(source, target, buffer: bytearray):
+        """Copy source to target through a caller-owned buffer."""
+        view = memoryview(buffer)
+        while True:
+            n = source.readinto(view)
+            if not n:
+                break
+            target.write(view[:n])
+    
     def _create_manifest(self, vts_root: Path, options: BackupOptions) -> Dict[str, Any]:
         """Create backup manifest with metadata."""
         return {
@@ -109,8 +109,8 @@ class VTSFileParser:
             Parsed JSON data or None if failed
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # json.loads detects the encoding (and a UTF-8 BOM) from the raw bytes
+            data = json.loads(path.read_bytes())
             logger.debug(f"✓ Loaded {path.name}")
             return data
         except json.JSONDecodeError as e:
@@ -139,8 +139,9 @@ class VTSFileParser:
                 logger.error(f"Validation failed before save: {validation.errors}")
                 return False
             
+            text = json.dumps(data, indent=2, ensure_ascii=False)
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(text)
             
             logger.info(f"✓ Saved {path.name}")
             return True
@@ -228,12 +228,14 @@ class ModelSelectorWidget(QWidget):
 class VTSModelManagerTab(QWidget):
     """Main tab for VTS model management."""
     
-    def __init__(self, parent=None):
+    def __init__(self, config_manager=None, parent=None):
         super().__init__(parent)
         
+        self.config = config_manager
         self.discovery = get_vts_discovery()
         self.manager = ModelSettingsManager()
-        self.renamer = ModelRenamer()
+        pretty_json = config_manager.get_bool('ModelManager', 'pretty_json', True) if config_manager else True
+        self.renamer = ModelRenamer(pretty_json=pretty_json)
         
         self.models: List[ModelInfo] = []
         
@@ -419,7 +421,7 @@ class VTSModelManagerTab(QWidget):
         layout.addWidget(info_label)
         
         # Profile manager widget
-        self.profile_manager = ProfileManagerWidget()
+        self.profile_manager = ProfileManagerWidget(self.config)
         layout.addWidget(self.profile_manager)
         
         return group
@@ -596,8 +598,7 @@ class VTSModelManagerTab(QWidget):
         """Show detailed transfer result."""
         from result_dialog import ResultDialog
         
-        dialog = ResultDialog(result, self)
-        dialog.exec()
+        ResultDialog.show_for(result, self)
     
     def rename_selected_model(self, model: ModelInfo):
         """Rename a selected model."""
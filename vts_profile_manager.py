@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,12 @@ class ProfileInfo:
     description: str = ""
     tags: List[str] = field(default_factory=list)
     
+    @cached_property
+    def created_display(self) -> str:
+        """Creation date for display (YYYY-MM-DD HH:MM), formatted once."""
+        d = self.created_date
+        return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -60,6 +67,9 @@ class VTSProfileManager:
         
         self.profiles_dir = profiles_dir
         self.profiles_dir.mkdir(exist_ok=True)
+        
+        # Scanned profile list; reset by every method that changes the profiles folder
+        self._profiles: Optional[List[ProfileInfo]] = None
         logger.info(f"VTSProfileManager initialized (profiles dir: {self.profiles_dir})")
     
     def save_profile(
@@ -83,6 +93,7 @@ class VTSProfileManager:
         Returns:
             True if successful, False otherwise
         """
+        self._profiles = None
         try:
             # Create profile data
             profile_data = {
@@ -134,13 +145,22 @@ class VTSProfileManager:
             logger.error(f"Failed to load profile {name}: {e}")
             return None
     
-    def list_profiles(self) -> List[ProfileInfo]:
+    def list_profiles(self, refresh: bool = False) -> List[ProfileInfo]:
         """
         List all available profiles.
         
+        The scan is cached until a profile is saved, deleted or imported.
+        
+        Args:
+            refresh: Rescan the profiles folder even if a cached list exists
+                (picks up changes made outside this manager)
+        
         Returns:
             List of ProfileInfo objects
         """
+        if self._profiles is not None and not refresh:
+            return list(self._profiles)
+        
         profiles = []
         
         for profile_file in self.profiles_dir.glob("*.json"):
@@ -167,7 +187,8 @@ class VTSProfileManager:
         profiles.sort(key=lambda p: p.created_date, reverse=True)
         
         logger.info(f"✓ Found {len(profiles)} profiles")
-        return profiles
+        self._profiles = profiles
+        return list(profiles)
     
     def delete_profile(self, name: str) -> bool:
         """
@@ -179,6 +200,7 @@ class VTSProfileManager:
         Returns:
             True if successful, False otherwise
         """
+        self._profiles = None
         try:
             profile_path = self.profiles_dir / f"{name}.json"
             if not profile_path.exists():
@@ -229,6 +251,7 @@ class VTSProfileManager:
         Returns:
             Profile name if successful, None otherwise
         """
+        self._profiles = None
         try:
             if not import_path.exists():
                 logger.error(f"Import file not found: {import_path}")